@@ -1,3 +1,5 @@
+import type { IDataObject, IExecuteFunctions } from 'n8n-workflow';
+
 import * as create from '../../../../v2/actions/record/create.operation';
 import * as transport from '../../../../v2/transport';
 import { createMockExecuteFunction } from '../helpers';
@@ -83,19 +85,22 @@ describe('Test AirtableV2, create operation', () => {
 			'tblltable',
 		);
 
-		expect(transport.apiRequest).toHaveBeenCalledTimes(2);
-		expect(transport.apiRequest).toHaveBeenCalledWith('POST', 'appYoLbase/tblltable', {
-			fields: {
-				foo: 'foo 1',
-				bar: 'bar 1',
-			},
-			typecast: true,
-		});
+		expect(transport.apiRequest).toHaveBeenCalledTimes(1);
 		expect(transport.apiRequest).toHaveBeenCalledWith('POST', 'appYoLbase/tblltable', {
-			fields: {
-				foo: 'foo 2',
-				bar: 'bar 2',
-			},
+			records: [
+				{
+					fields: {
+						foo: 'foo 1',
+						bar: 'bar 1',
+					},
+				},
+				{
+					fields: {
+						foo: 'foo 2',
+						bar: 'bar 2',
+					},
+				},
+			],
 			typecast: true,
 		});
 	});
@@ -154,4 +159,120 @@ describe('Test AirtableV2, create operation', () => {
 			typecast: false,
 		});
 	});
+
+	it('should split creates into batches of 10 records', async () => {
+		const nodeParameters = {
+			operation: 'create',
+			columns: {
+				mappingMode: 'autoMapInputData',
+				value: {},
+				matchingColumns: [],
+				schema: [],
+			},
+			options: {},
+		};
+
+		const items = Array.from({ length: 12 }, (_, i) => ({ json: { foo: `foo ${i}` } }));
+
+		await create.execute.call(
+			createMockExecuteFunction(nodeParameters),
+			items,
+			'appYoLbase',
+			'tblltable',
+		);
+
+		expect(transport.apiRequest).toHaveBeenCalledTimes(2);
+		expect((transport.apiRequest as jest.Mock).mock.calls[0][2].records).toHaveLength(10);
+		expect((transport.apiRequest as jest.Mock).mock.calls[1][2].records).toEqual([
+			{ fields: { foo: 'foo 10' } },
+			{ fields: { foo: 'foo 11' } },
+		]);
+	});
+
+	describe('when a batch fails', () => {
+		const nodeParameters = {
+			operation: 'create',
+			columns: {
+				mappingMode: 'autoMapInputData',
+				value: {},
+				matchingColumns: [],
+				schema: [],
+			},
+			options: {},
+		};
+
+		const items = [
+			{ json: { foo: 'foo 0' } },
+			{ json: { foo: 'bad' } },
+			{ json: { foo: 'foo 2' } },
+		];
+
+		beforeEach(() => {
+			(transport.apiRequest as jest.Mock).mockImplementation(
+				async (_method: string, _endpoint: string, body: IDataObject) => {
+					// Airtable rejects the whole batch when one of its records is invalid
+					if (body.records) {
+						throw Object.assign(new Error('INVALID_RECORDS'), { httpCode: '422' });
+					}
+					const fields = body.fields as IDataObject;
+					if (fields.foo === 'bad') {
+						throw Object.assign(new Error('INVALID_VALUE_FOR_COLUMN'), { httpCode: '422' });
+					}
+					return { id: `rec ${fields.foo}`, fields };
+				},
+			);
+		});
+
+		afterEach(() => {
+			(transport.apiRequest as jest.Mock).mockImplementation(async () => ({}));
+		});
+
+		it('should create the records before the failing one and report its item index', async () => {
+			await expect(
+				create.execute.call(
+					createMockExecuteFunction(nodeParameters),
+					items,
+					'appYoLbase',
+					'tblltable',
+				),
+			).rejects.toMatchObject({ context: { itemIndex: 1 } });
+
+			const calls = (transport.apiRequest as jest.Mock).mock.calls;
+			expect(calls).toHaveLength(3);
+			expect(calls[1][2]).toEqual({ fields: { foo: 'foo 0' }, typecast: false });
+			expect(calls[2][2]).toEqual({ fields: { foo: 'bad' }, typecast: false });
+		});
+
+		it('should create every valid record and return the error in place, continueOnFail', async () => {
+			const result = await create.execute.call(
+				{ ...createMockExecuteFunction(nodeParameters), continueOnFail: () => true } as IExecuteFunctions,
+				items,
+				'appYoLbase',
+				'tblltable',
+			);
+
+			expect(transport.apiRequest).toHaveBeenCalledTimes(4);
+			expect(result).toHaveLength(3);
+			expect(result[0].json).toEqual({ id: 'rec foo 0', foo: 'foo 0' });
+			expect(result[1].json.message).toBe('INVALID_VALUE_FOR_COLUMN');
+			expect(result[1].json.error).toMatchObject({ context: { itemIndex: 1 } });
+			expect(result[2].json).toEqual({ id: 'rec foo 2', foo: 'foo 2' });
+		});
+
+		it('should raise other errors unchanged without replaying the batch', async () => {
+			const rateLimited = Object.assign(new Error('RATE_LIMIT_REACHED'), { httpCode: '429' });
+			(transport.apiRequest as jest.Mock).mockRejectedValue(rateLimited);
+
+			await expect(
+				create.execute.call(
+					{ ...createMockExecuteFunction(nodeParameters), continueOnFail: () => true } as IExecuteFunctions,
+					items,
+					'appYoLbase',
+					'tblltable',
+				),
+			).rejects.toBe(rateLimited);
+
+			expect(transport.apiRequest).toHaveBeenCalledTimes(1);
+		});
+	});
 });
@@ -1,3 +1,5 @@
+import type { IDataObject, IExecuteFunctions } from 'n8n-workflow';
+
 import * as update from '../../../../v2/actions/record/update.operation';
 import * as transport from '../../../../v2/transport';
 import { createMockExecuteFunction } from '../helpers';
@@ -105,4 +107,219 @@ describe('Test AirtableV2, update operation', () => {
 			[{ fields: { bar: 'bar 1', foo: 'foo 1', id: 'recXXX' }, id: 'recXXX' }],
 		);
 	});
+
+	it('should write consecutive items in one batch', async () => {
+		jest.clearAllMocks();
+
+		const nodeParameters = {
+			operation: 'update',
+			columns: {
+				mappingMode: 'autoMapInputData',
+				matchingColumns: ['id'],
+			},
+			options: {},
+		};
+
+		const items = [
+			{
+				json: {
+					id: 'recXXX',
+					foo: 'foo 1',
+				},
+			},
+			{
+				json: {
+					id: 'recYYY',
+					foo: 'foo 2',
+				},
+			},
+		];
+
+		await update.execute.call(
+			createMockExecuteFunction(nodeParameters),
+			items,
+			'appYoLbase',
+			'tblltable',
+		);
+
+		expect(transport.batchUpdate).toHaveBeenCalledTimes(1);
+		expect(transport.batchUpdate).toHaveBeenCalledWith(
+			'appYoLbase/tblltable',
+			{ typecast: false },
+			[
+				{ fields: { foo: 'foo 1' }, id: 'recXXX' },
+				{ fields: { foo: 'foo 2' }, id: 'recYYY' },
+			],
+		);
+	});
+
+	describe('queued batches', () => {
+		const nodeParameters = {
+			operation: 'update',
+			columns: {
+				mappingMode: 'autoMapInputData',
+				matchingColumns: ['id'],
+			},
+			options: {},
+		};
+
+		const echoRecords = async (_endpoint: string, _body: IDataObject, records: IDataObject[]) => ({
+			records: records.map(({ id, fields }) => ({ id, fields })),
+		});
+
+		/** Mock context whose options differ per item */
+		const withItemOptions = (itemOptions: IDataObject[], continueOnFail = false) => {
+			const context = createMockExecuteFunction(nodeParameters);
+			const getNodeParameter = context.getNodeParameter;
+			return {
+				...context,
+				getNodeParameter: (parameterName: string, itemIndex: number, ...rest: any[]) =>
+					parameterName === 'options'
+						? itemOptions[itemIndex]
+						: (getNodeParameter as any)(parameterName, itemIndex, ...rest),
+				continueOnFail: () => continueOnFail,
+			} as unknown as IExecuteFunctions;
+		};
+
+		const batchUpdateCalls = () =>
+			(transport.batchUpdate as jest.Mock).mock.calls.map(([, body, records]) => ({
+				typecast: body.typecast,
+				ids: (records as IDataObject[]).map(({ id }) => id),
+			}));
+
+		beforeEach(() => {
+			jest.clearAllMocks();
+			(transport.batchUpdate as jest.Mock).mockImplementation(echoRecords);
+		});
+
+		afterEach(() => {
+			(transport.batchUpdate as jest.Mock).mockImplementation(async () => ({}));
+		});
+
+		describe('when the combined PATCH fails', () => {
+			const items = [
+				{ json: { id: 'rec0', foo: 'foo 0' } },
+				{ json: { id: 'recBad', foo: 'bad' } },
+				{ json: { id: 'rec2', foo: 'foo 2' } },
+			];
+
+			beforeEach(() => {
+				(transport.batchUpdate as jest.Mock).mockImplementation(
+					async (endpoint: string, body: IDataObject, records: IDataObject[]) => {
+						// Airtable rejects the whole batch when one of its records is invalid
+						if (records.length > 1 || (records[0].fields as IDataObject).foo === 'bad') {
+							throw Object.assign(new Error('INVALID_VALUE_FOR_COLUMN'), { httpCode: '422' });
+						}
+						return await echoRecords(endpoint, body, records);
+					},
+				);
+			});
+
+			it('should replay item by item and throw at the failing item', async () => {
+				await expect(
+					update.execute.call(withItemOptions([{}, {}, {}]), items, 'appYoLbase', 'tblltable'),
+				).rejects.toMatchObject({ context: { itemIndex: 1 } });
+
+				expect(batchUpdateCalls()).toEqual([
+					{ typecast: false, ids: ['rec0', 'recBad', 'rec2'] },
+					{ typecast: false, ids: ['rec0'] },
+					{ typecast: false, ids: ['recBad'] },
+				]);
+			});
+
+			it('should keep output order with the error in place, continueOnFail', async () => {
+				const result = await update.execute.call(
+					withItemOptions([{}, {}, {}], true),
+					items,
+					'appYoLbase',
+					'tblltable',
+				);
+
+				expect(batchUpdateCalls()).toEqual([
+					{ typecast: false, ids: ['rec0', 'recBad', 'rec2'] },
+					{ typecast: false, ids: ['rec0'] },
+					{ typecast: false, ids: ['recBad'] },
+					{ typecast: false, ids: ['rec2'] },
+				]);
+				expect(result).toHaveLength(3);
+				expect(result[0].json).toEqual({ id: 'rec0', foo: 'foo 0' });
+				expect(result[1].json.message).toBe('INVALID_VALUE_FOR_COLUMN');
+				expect(result[1].json.error).toMatchObject({ context: { itemIndex: 1 } });
+				expect(result[2].json).toEqual({ id: 'rec2', foo: 'foo 2' });
+			});
+
+			it('should raise other errors unchanged without replaying the batch', async () => {
+				const rateLimited = Object.assign(new Error('RATE_LIMIT_REACHED'), { httpCode: '429' });
+				(transport.batchUpdate as jest.Mock).mockRejectedValue(rateLimited);
+
+				await expect(
+					update.execute.call(withItemOptions([{}, {}, {}], true), items, 'appYoLbase', 'tblltable'),
+				).rejects.toBe(rateLimited);
+
+				expect(batchUpdateCalls()).toEqual([{ typecast: false, ids: ['rec0', 'recBad', 'rec2'] }]);
+			});
+		});
+
+		it('should start a new batch when typecast changes', async () => {
+			const items = [
+				{ json: { id: 'rec0', foo: 'foo 0' } },
+				{ json: { id: 'rec1', foo: 'foo 1' } },
+				{ json: { id: 'rec2', foo: 'foo 2' } },
+			];
+
+			const result = await update.execute.call(
+				withItemOptions([{}, { typecast: true }, { typecast: true }]),
+				items,
+				'appYoLbase',
+				'tblltable',
+			);
+
+			expect(batchUpdateCalls()).toEqual([
+				{ typecast: false, ids: ['rec0'] },
+				{ typecast: true, ids: ['rec1', 'rec2'] },
+			]);
+			expect(result.map(({ json }) => json.id)).toEqual(['rec0', 'rec1', 'rec2']);
+		});
+
+		it('should start a new batch when it would exceed 10 records', async () => {
+			const items = Array.from({ length: 12 }, (_, i) => ({ json: { id: `rec${i}`, foo: `foo ${i}` } }));
+
+			const result = await update.execute.call(
+				withItemOptions(items.map(() => ({}))),
+				items,
+				'appYoLbase',
+				'tblltable',
+			);
+
+			const calls = batchUpdateCalls();
+			expect(calls).toHaveLength(2);
+			expect(calls[0].ids).toHaveLength(10);
+			expect(calls[1].ids).toEqual(['rec10', 'rec11']);
+			expect(result.map(({ json }) => json.id)).toEqual(items.map(({ json }) => json.id));
+		});
+
+		it('should write queued items before an item reads the current record', async () => {
+			const items = [
+				{ json: { id: 'rec0', foo: 'foo 0' } },
+				{ json: { id: 'rec1', foo: 'foo 1' } },
+			];
+
+			await update.execute.call(
+				withItemOptions([{}, { arrayMergeStrategy: 'append' }]),
+				items,
+				'appYoLbase',
+				'tblltable',
+			);
+
+			expect(batchUpdateCalls()).toEqual([
+				{ typecast: false, ids: ['rec0'] },
+				{ typecast: false, ids: ['rec1'] },
+			]);
+
+			const [firstWrite] = (transport.batchUpdate as jest.Mock).mock.invocationCallOrder;
+			const [read] = (transport.apiRequest as jest.Mock).mock.invocationCallOrder;
+			expect(transport.apiRequest).toHaveBeenCalledWith('GET', 'appYoLbase/tblltable/rec1');
+			expect(firstWrite).toBeLessThan(read);
+		});
+	});
 });
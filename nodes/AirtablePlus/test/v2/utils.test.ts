@@ -1,4 +1,4 @@
-import { findMatches, removeIgnored } from '../../v2/helpers/utils';
+import { findMatches, indexRecordsByKeys, removeIgnored } from '../../v2/helpers/utils';
 
 describe('test AirtableV2, removeIgnored', () => {
 	it('should remove ignored fields', () => {
@@ -122,4 +122,33 @@ describe('test AirtableV2, findMatches', () => {
 			},
 		]);
 	});
+	it('should find the same matches through a prebuilt index', () => {
+		const data = [
+			{
+				fields: {
+					name: 'foo',
+					email: '',
+				},
+			},
+			{
+				fields: {
+					name: 'bar',
+					email: 'bar@example.com',
+				},
+			},
+			{
+				fields: {
+					name: 'foo',
+				},
+			},
+		];
+
+		const keys = ['name', 'email'];
+		const index = indexRecordsByKeys(data, keys);
+
+		const result = findMatches(data, keys, { name: 'foo', email: null }, true, index);
+
+		expect(result).toEqual([data[0], data[2]]);
+		expect(result).toEqual(findMatches(data, keys, { name: 'foo', email: null }, true));
+	});
 });
@@ -9,6 +9,7 @@ import type {
 import { updateDisplayOptions, wrapData } from '../../../../../utils/utilities';
 import { processAirtableError, removeIgnored, removeEmptyFields, processOutputFieldRenaming } from '../../helpers/utils';
 import { apiRequest } from '../../transport';
+import { createBatchedWriter, type QueuedWrite } from '../../helpers/batchUtils';
 import {
 	insertUpdateOptions,
 	linkedTargetTable,
@@ -49,85 +50,104 @@ export const description: INodeProperties[] = [
 	},
 ];
 
+interface PendingCreate extends QueuedWrite {
+	options: IDataObject;
+	fields: IDataObject;
+}
+
 export async function execute(
 	this: IExecuteFunctions,
 	items: INodeExecutionData[],
 	base: string,
 	table: string,
 ): Promise<INodeExecutionData[]> {
-	const returnData: INodeExecutionData[] = [];
+	const results: INodeExecutionData[][] = [];
 
 	const endpoint = `${base}/${table}`;
 
 	const dataMode = this.getNodeParameter('columns.mappingMode', 0) as string;
 
-	for (let i = 0; i < items.length; i++) {
-		try {
-			const options = this.getNodeParameter('options', i, {});
-
-			const body: IDataObject = {
-				typecast: options.typecast ? true : false,
+	const wrapRecord = (record: IDataObject, { itemIndex, options }: PendingCreate) => {
+		// Apply field renaming before including input data
+		let dataToWrap = processOutputFieldRenaming(
+			record,
+			options.renameIdField as string,
+			options.renameOutputFields as string
+		);
+
+		// Include input data if option is enabled
+		if (options.includeInputData) {
+			dataToWrap = {
+				...items[itemIndex].json,
+				...dataToWrap,
 			};
-
-					let fields: IDataObject = {};
-
-		if (dataMode === 'autoMapInputData') {
-			fields = removeIgnored(items[i].json, options.ignoreFields as string);
-		}
-
-		if (dataMode === 'defineBelow') {
-			fields = this.getNodeParameter('columns.value', i, []) as IDataObject;
 		}
 
-		// Remove empty/null fields if requested
-		if (options.skipEmptyFields) {
-			fields = removeEmptyFields(fields as IDataObject);
-		}
+		results[itemIndex] = this.helpers.constructExecutionMetaData(
+			wrapData([dataToWrap]),
+			{ itemData: { item: itemIndex } },
+		);
+	};
+
+	// Consecutive items are queued and created together, up to 10 records per request
+	const writer = createBatchedWriter<PendingCreate>(this, results, {
+		writeBatch: async (batch, typecast) => {
+			const responseData = await apiRequest.call(this, 'POST', endpoint, {
+				records: batch.map(({ fields }) => ({ fields })),
+				typecast,
+			});
+
+			// Airtable returns the created records in the order they were sent
+			const records = ((responseData as IDataObject).records as IDataObject[]) || [];
+			batch.forEach((create, position) => wrapRecord(records[position] || {}, create));
+		},
+		writeItem: async (create, typecast) => {
+			const responseData = await apiRequest.call(this, 'POST', endpoint, {
+				typecast,
+				fields: create.fields,
+			});
 
-		body.fields = fields;
+			// Handle both single record and array responses
+			const record = Array.isArray(responseData) ? responseData[0] || responseData : responseData;
+			wrapRecord(record as IDataObject, create);
+		},
+	});
 
-		const responseData = await apiRequest.call(this, 'POST', endpoint, body);
+	for (let i = 0; i < items.length; i++) {
+		try {
+			const options = this.getNodeParameter('options', i, {});
+			const typecast = options.typecast ? true : false;
 
-			let dataToWrap: IDataObject;
+			let fields: IDataObject = {};
 
-			// Handle both single record and array responses
-			if (Array.isArray(responseData)) {
-				// If it's an array, take the first item for single record creation
-				dataToWrap = responseData[0] || responseData;
-			} else {
-				dataToWrap = responseData as IDataObject;
+			if (dataMode === 'autoMapInputData') {
+				fields = removeIgnored(items[i].json, options.ignoreFields as string);
 			}
 
-			// Apply field renaming before including input data
-			dataToWrap = processOutputFieldRenaming(
-				dataToWrap,
-				options.renameIdField as string,
-				options.renameOutputFields as string
-			);
-
-			// Include input data if option is enabled
-			if (options.includeInputData) {
-				dataToWrap = {
-					...items[i].json,
-					...dataToWrap,
-				};
+			if (dataMode === 'defineBelow') {
+				fields = this.getNodeParameter('columns.value', i, []) as IDataObject;
 			}
 
-			const executionData = this.helpers.constructExecutionMetaData(
-				wrapData([dataToWrap]),
-				{ itemData: { item: i } },
-			);
+			// Remove empty/null fields if requested
+			if (options.skipEmptyFields) {
+				fields = removeEmptyFields(fields as IDataObject);
+			}
 
-			returnData.push(...executionData);
+			await writer.add({ itemIndex: i, options, fields }, typecast);
+			if (writer.failure) break;
 		} catch (error) {
 			error = processAirtableError(error as NodeApiError, undefined, i);
 			if (this.continueOnFail()) {
-				returnData.push({ json: { message: error.message, error } });
+				results[i] = [{ json: { message: error.message, error } }];
 				continue;
 			}
-			throw error;
+			// Earlier items are still created before the error is raised
+			await writer.flush();
+			throw writer.failure || error;
 		}
 	}
 
-	return returnData;
+	await writer.finish();
+
+	return results.flat();
 }
@@ -8,8 +8,9 @@ import type {
 
 import { updateDisplayOptions, wrapData } from '../../../../../utils/utilities';
 import type { UpdateRecord, FieldUpdateOptions, FieldUpdateRule } from '../../helpers/interfaces';
-import { findMatches, processAirtableError, removeIgnored, removeEmptyFields, processOutputFieldRenaming } from '../../helpers/utils';
+import { findMatches, indexRecordsByKeys, processAirtableError, removeIgnored, removeEmptyFields, processOutputFieldRenaming } from '../../helpers/utils';
 import { apiRequestAllItems, batchUpdate, apiRequest } from '../../transport';
+import { createBatchedWriter, type QueuedWrite } from '../../helpers/batchUtils';
 import {
 	insertUpdateOptions,
 	linkedTargetTable,
@@ -52,13 +53,18 @@ export const description: INodeProperties[] = [
 	},
 ];
 
+interface PendingUpdate extends QueuedWrite {
+	records: UpdateRecord[];
+	options: IDataObject;
+}
+
 export async function execute(
 	this: IExecuteFunctions,
 	items: INodeExecutionData[],
 	base: string,
 	table: string,
 ): Promise<INodeExecutionData[]> {
-	const returnData: INodeExecutionData[] = [];
+	const results: INodeExecutionData[][] = [];
 
 	const endpoint = `${base}/${table}`;
 
@@ -77,6 +83,79 @@ export async function execute(
 		);
 		tableData = response.records as UpdateRecord[];
 	}
+	const tableIndex = indexRecordsByKeys(tableData, columnsToMatchOn);
+
+	// Current records read for array merging and field update rules, refreshed with the
+	// records this execution writes so repeat reads of the same record skip the GET
+	const existingRecords = new Map<string, IDataObject>();
+
+	const getExistingRecord = async (id: string) => {
+		let existingRecord = existingRecords.get(id);
+		if (!existingRecord) {
+			existingRecord = (await apiRequest.call(this, 'GET', `${endpoint}/${id}`)) as IDataObject;
+			existingRecords.set(id, existingRecord);
+		}
+		return existingRecord;
+	};
+
+	const rememberWritten = (records: IDataObject[]) => {
+		for (const record of records) {
+			if (record.id) {
+				existingRecords.set(record.id as string, record);
+			}
+		}
+	};
+
+	const wrapRecords = (records: IDataObject[], { itemIndex, options }: PendingUpdate) => {
+		// Apply field renaming
+		let dataToWrap = records.map((result) => {
+			return processOutputFieldRenaming(
+				result,
+				options.renameIdField as string,
+				options.renameOutputFields as string
+			);
+		});
+
+		// Include input data if option is enabled
+		if (options.includeInputData) {
+			dataToWrap = dataToWrap.map((result) => ({
+				...items[itemIndex].json,
+				...result,
+			}));
+		}
+
+		results[itemIndex] = this.helpers.constructExecutionMetaData(
+			wrapData(dataToWrap),
+			{ itemData: { item: itemIndex } },
+		);
+	};
+
+	// Consecutive items are queued and written together, up to 10 records per request
+	const writer = createBatchedWriter<PendingUpdate>(this, results, {
+		writeBatch: async (batch, typecast) => {
+			const responseData = await batchUpdate.call(
+				this,
+				endpoint,
+				{ typecast },
+				batch.flatMap(({ records }) => records),
+			);
+
+			// Airtable returns the updated records in the order they were sent
+			const updatedRecords = (responseData.records as IDataObject[]) || [];
+			rememberWritten(updatedRecords);
+			let offset = 0;
+			for (const update of batch) {
+				wrapRecords(updatedRecords.slice(offset, offset + update.records.length), update);
+				offset += update.records.length;
+			}
+		},
+		writeItem: async (update, typecast) => {
+			const responseData = await batchUpdate.call(this, endpoint, { typecast }, update.records);
+			const updatedRecords = (responseData.records as IDataObject[]) || [];
+			rememberWritten(updatedRecords);
+			wrapRecords(updatedRecords, update);
+		},
+	});
 
 	for (let i = 0; i < items.length; i++) {
 		let recordId = '';
@@ -96,11 +175,11 @@ export async function execute(
 				? ((options.fieldUpdateRules as any)?.rules as FieldUpdateRule[] || [])
 				: [];
 
-			console.log('🔍 Field update strategy configuration:', {
-				strategy: fieldUpdateStrategy,
-				rulesCount: fieldUpdateRules.length,
-				rules: fieldUpdateRules
-			});
+			// Items that read the current record must see the writes queued before them
+			if (arrayHandlingOptions.arrayMergeStrategy !== 'replace' || fieldUpdateRules.length > 0) {
+				await writer.flush();
+				if (writer.failure) break;
+			}
 
 			if (dataMode === 'autoMapInputData') {
 				if (columnsToMatchOn.includes('id')) {
@@ -114,7 +193,7 @@ export async function execute(
 					if (arrayHandlingOptions.arrayMergeStrategy !== 'replace' || fieldUpdateRules.length > 0) {
 						// Fetch existing record for array merging and/or field update rules
 						try {
-							const existingRecord = await apiRequest.call(this, 'GET', `${endpoint}/${recordId}`);
+							const existingRecord = await getExistingRecord(recordId);
 							existingRecordFields = existingRecord.fields as IDataObject;
 
 							// Apply array handling if enabled
@@ -136,11 +215,6 @@ export async function execute(
 
 					// Apply field update rules if enabled
 					if (fieldUpdateRules.length > 0 && existingRecordFields) {
-						console.log('🚀 Calling processFieldUpdateRules with:', {
-							fieldsToProcess: Object.keys(processedFields),
-							existingFieldsKeys: Object.keys(existingRecordFields),
-							rulesCount: fieldUpdateRules.length
-						});
 						processedFields = await processFieldUpdateRules.call(
 							this,
 							base,
@@ -149,11 +223,6 @@ export async function execute(
 							existingRecordFields,
 							fieldUpdateRules,
 						);
-					} else {
-						console.log('🚫 NOT calling processFieldUpdateRules:', {
-							hasRules: fieldUpdateRules.length > 0,
-							hasExistingFields: !!existingRecordFields
-						});
 					}
 
 					records.push({
@@ -166,6 +235,7 @@ export async function execute(
 						columnsToMatchOn,
 						items[i].json,
 						options.updateAllMatches as boolean,
+						tableIndex,
 					);
 
 					for (const match of matches) {
@@ -176,7 +246,7 @@ export async function execute(
 						let existingRecordFields: IDataObject | null = null;
 						if (arrayHandlingOptions.arrayMergeStrategy !== 'replace' || fieldUpdateRules.length > 0) {
 							try {
-								const existingRecord = await apiRequest.call(this, 'GET', `${endpoint}/${id}`);
+								const existingRecord = await getExistingRecord(id);
 								existingRecordFields = existingRecord.fields as IDataObject;
 
 								// Apply array handling if enabled
@@ -223,7 +293,7 @@ export async function execute(
 					let existingRecordFields: IDataObject | null = null;
 					if (arrayHandlingOptions.arrayMergeStrategy !== 'replace' || fieldUpdateRules.length > 0) {
 						try {
-							const existingRecord = await apiRequest.call(this, 'GET', `${endpoint}/${recordId}`);
+							const existingRecord = await getExistingRecord(recordId);
 							existingRecordFields = existingRecord.fields as IDataObject;
 
 							// Apply array handling if enabled
@@ -263,6 +333,7 @@ export async function execute(
 						columnsToMatchOn,
 						fields,
 						options.updateAllMatches as boolean,
+						tableIndex,
 					);
 
 					for (const match of matches) {
@@ -273,7 +344,7 @@ export async function execute(
 						let existingRecordFields: IDataObject | null = null;
 						if (arrayHandlingOptions.arrayMergeStrategy !== 'replace' || fieldUpdateRules.length > 0) {
 							try {
-								const existingRecord = await apiRequest.call(this, 'GET', `${endpoint}/${id}`);
+								const existingRecord = await getExistingRecord(id);
 								existingRecordFields = existingRecord.fields as IDataObject;
 
 								// Apply array handling if enabled
@@ -309,7 +380,7 @@ export async function execute(
 				}
 			}
 
-			const body: IDataObject = { typecast: options.typecast ? true : false };
+			const typecast = options.typecast ? true : false;
 
 			// Remove empty/null fields if requested
 			if (options.skipEmptyFields) {
@@ -318,42 +389,21 @@ export async function execute(
 				});
 			}
 
-			const responseData = await batchUpdate.call(this, endpoint, body, records);
-
-			let dataToWrap = responseData.records as IDataObject[];
-
-			// Apply field renaming
-			dataToWrap = dataToWrap.map((result) => {
-				return processOutputFieldRenaming(
-					result,
-					options.renameIdField as string,
-					options.renameOutputFields as string
-				);
-			});
-
-			// Include input data if option is enabled
-			if (options.includeInputData) {
-				dataToWrap = dataToWrap.map((result) => ({
-					...items[i].json,
-					...result,
-				}));
-			}
-
-			const executionData = this.helpers.constructExecutionMetaData(
-				wrapData(dataToWrap),
-				{ itemData: { item: i } },
-			);
-
-			returnData.push(...executionData);
+			await writer.add({ itemIndex: i, recordId, records, recordCount: records.length, options }, typecast);
+			if (writer.failure) break;
 		} catch (error) {
 			error = processAirtableError(error as NodeApiError, recordId, i);
 			if (this.continueOnFail()) {
-				returnData.push({ json: { message: error.message, error } });
+				results[i] = [{ json: { message: error.message, error } }];
 				continue;
 			}
-			throw error;
+			// Earlier items are still written before the error is raised
+			await writer.flush();
+			throw writer.failure || error;
 		}
 	}
 
-	return returnData;
+	await writer.finish();
+
+	return results.flat();
 }
@@ -133,6 +133,50 @@ export async function execute(
 	const matchingStrategy = this.getNodeParameter('matchingStrategy', 0, 'rigid') as 'rigid' | 'soft' | 'flexible';
 	const requiredCombinations = this.getNodeParameter('requiredCombinations', 0, { combinations: [] }) as { combinations: Array<{ fields: string[] }> };
 
+	// Soft and flexible matching compare every item against the whole table. Fetch it once per
+	// execution, and keep it in sync with the records this execution creates or updates so later
+	// items still match them. Only the fields items can match on are fetched, unless array merging
+	// or field update rules need the full current record, in which case the snapshot is refetched
+	// with all fields.
+	const matchFields = matchingStrategy === 'flexible'
+		? [...new Set(requiredCombinations.combinations.flatMap(({ fields }) => fields))]
+		: columnsToMatchOn;
+
+	let tableRecords: UpdateRecord[] | undefined;
+	let tableRecordsHaveAllFields = false;
+	const tableRecordIndexById = new Map<string, number>();
+
+	const getTableRecords = async (allFields: boolean): Promise<UpdateRecord[]> => {
+		if (!tableRecords || (allFields && !tableRecordsHaveAllFields)) {
+			const response = await apiRequestAllItems.call(
+				this,
+				'GET',
+				endpoint,
+				{},
+				allFields ? {} : { fields: matchFields },
+			);
+			tableRecords = response.records as UpdateRecord[];
+			tableRecordsHaveAllFields = allFields;
+			tableRecordIndexById.clear();
+			tableRecords.forEach((record, index) => tableRecordIndexById.set(record.id as string, index));
+		}
+		return tableRecords;
+	};
+
+	const syncTableRecords = (writtenRecords: IDataObject[]) => {
+		if (!tableRecords) return;
+		for (const written of writtenRecords) {
+			const record = { id: written.id as string, fields: (written.fields as IDataObject) || {} };
+			const index = tableRecordIndexById.get(record.id);
+			if (index === undefined) {
+				tableRecordIndexById.set(record.id, tableRecords.length);
+				tableRecords.push(record);
+			} else {
+				tableRecords[index] = record;
+			}
+		}
+	};
+
 	for (let i = 0; i < items.length; i++) {
 		try {
 			const records: UpdateRecord[] = [];
@@ -150,11 +194,7 @@ export async function execute(
 				? ((options.fieldUpdateRules as any)?.rules as FieldUpdateRule[] || [])
 				: [];
 
-			console.log('🔍 UPSERT Field update strategy configuration:', {
-				strategy: fieldUpdateStrategy,
-				rulesCount: fieldUpdateRules.length,
-				rules: fieldUpdateRules
-			});
+			const needsExistingFields = arrayHandlingOptions.arrayMergeStrategy !== 'replace' || fieldUpdateRules.length > 0;
 
 			if (dataMode === 'autoMapInputData') {
 				if (columnsToMatchOn.includes('id')) {
@@ -231,8 +271,6 @@ export async function execute(
 				}
 			}
 
-
-
 			let responseData;
 
 					// Handle different matching strategies
@@ -255,25 +293,7 @@ export async function execute(
 					responseData = await apiRequest.call(this, 'POST', endpoint, createBody);
 				} else {
 					// Use the valid fields for matching
-					// If we have field update rules, fetch all fields, otherwise just matching fields for efficiency
-					const searchParams = fieldUpdateRules.length > 0
-						? {} // Fetch all fields when field update rules are present
-						: { fields: fieldsToMatch }; // Only matching fields for efficiency
-
-					console.log('🔧 UPSERT: Search params for field update rules:', {
-						hasFieldUpdateRules: fieldUpdateRules.length > 0,
-						searchParams
-					});
-
-					const response = await apiRequestAllItems.call(
-						this,
-						'GET',
-						endpoint,
-						{},
-						searchParams,
-					);
-
-					let matches = response.records as UpdateRecord[];
+					let matches = await getTableRecords(needsExistingFields);
 					matches = matches.filter(record => {
 						return fieldsToMatch.every(field => {
 							const inputValue = inputFields[field];
@@ -313,11 +333,6 @@ export async function execute(
 
 							// Apply field update rules if enabled
 							if (fieldUpdateRules.length > 0) {
-								console.log('🚀 UPSERT Calling processFieldUpdateRules with:', {
-									fieldsToProcess: Object.keys(fieldsToUpdate),
-									existingFieldsKeys: Object.keys(match.fields as IDataObject),
-									rulesCount: fieldUpdateRules.length
-								});
 								try {
 									fieldsToUpdate = await processFieldUpdateRules.call(
 										this,
@@ -330,11 +345,6 @@ export async function execute(
 								} catch (error) {
 									console.warn(`Could not apply field update rules for record ${match.id}:`, error);
 								}
-							} else {
-								console.log('🚫 UPSERT NOT calling processFieldUpdateRules:', {
-									hasRules: fieldUpdateRules.length > 0,
-									hasExistingFields: !!(match.fields as IDataObject)
-								});
 							}
 
 							updateRecords.push({ id: match.id, fields: fieldsToUpdate });
@@ -344,57 +354,27 @@ export async function execute(
 				}
 			} else {
 				// Flexible matching: use custom field combination rules
-				console.log('🔧 FLEXIBLE_DEBUG: Input fields:', JSON.stringify(inputFields, null, 2));
-				console.log('🔧 FLEXIBLE_DEBUG: Required combinations:', JSON.stringify(requiredCombinations, null, 2));
-
 				// Check which combinations are satisfied (all fields in combination have values)
-				const satisfiedCombinations = requiredCombinations.combinations.filter(combination => {
-					const isValid = combination.fields.every(field => {
+				const satisfiedCombinations = requiredCombinations.combinations.filter(combination =>
+					combination.fields.every(field => {
 						const value = inputFields[field];
-						const hasValue = value !== null && value !== undefined && value !== '';
-						console.log(`🔧 FLEXIBLE_DEBUG: Field "${field}" = "${value}" (hasValue: ${hasValue})`);
-						return hasValue;
-					});
-					console.log(`🔧 FLEXIBLE_DEBUG: Combination [${combination.fields.join(', ')}] is valid: ${isValid}`);
-					return isValid;
-				});
-
-				console.log('🔧 FLEXIBLE_DEBUG: Satisfied combinations:', JSON.stringify(satisfiedCombinations, null, 2));
+						return value !== null && value !== undefined && value !== '';
+					}),
+				);
 
 				if (satisfiedCombinations.length === 0) {
 					// No combinations satisfied - create new record
-					console.log('🔧 FLEXIBLE_DEBUG: No combinations satisfied - creating new record');
 					const createBody = {
 						...body,
 						records: records.map(({ fields }) => ({ fields: removeEmptyFields(fields) })),
 					};
-					console.log('🔧 FLEXIBLE_DEBUG: Create body:', JSON.stringify(createBody, null, 2));
 					responseData = await apiRequest.call(this, 'POST', endpoint, createBody);
 				} else {
 					// Use the first satisfied combination for matching
 					const fieldsToMatch = satisfiedCombinations[0].fields;
-					console.log('🔧 FLEXIBLE_DEBUG: Using fields for matching:', fieldsToMatch);
 
 					// Get all records to check for matches
-					// If we have field update rules, fetch all fields, otherwise just matching fields for efficiency
-					const searchParams = fieldUpdateRules.length > 0
-						? {} // Fetch all fields when field update rules are present
-						: { fields: fieldsToMatch }; // Only matching fields for efficiency
-
-					console.log('🔧 UPSERT: Search params for field update rules:', {
-						hasFieldUpdateRules: fieldUpdateRules.length > 0,
-						searchParams
-					});
-
-					const response = await apiRequestAllItems.call(
-						this,
-						'GET',
-						endpoint,
-						{},
-						searchParams,
-					);
-
-					let matches = response.records as UpdateRecord[];
+					let matches = await getTableRecords(needsExistingFields);
 
 					// Client-side filtering - match records where all fields in the combination match exactly
 					matches = matches.filter(record => {
@@ -436,11 +416,6 @@ export async function execute(
 
 							// Apply field update rules if enabled
 							if (fieldUpdateRules.length > 0) {
-								console.log('🚀 UPSERT (updateAll) Calling processFieldUpdateRules with:', {
-									fieldsToProcess: Object.keys(fieldsToUpdate),
-									existingFieldsKeys: Object.keys(match.fields as IDataObject),
-									rulesCount: fieldUpdateRules.length
-								});
 								try {
 									fieldsToUpdate = await processFieldUpdateRules.call(
 										this,
@@ -478,11 +453,6 @@ export async function execute(
 
 						// Apply field update rules if enabled
 						if (fieldUpdateRules.length > 0) {
-							console.log('🚀 UPSERT (single) Calling processFieldUpdateRules with:', {
-								fieldsToProcess: Object.keys(fieldsToUpdate),
-								existingFieldsKeys: Object.keys(matches[0].fields as IDataObject),
-								rulesCount: fieldUpdateRules.length
-							});
 							try {
 								fieldsToUpdate = await processFieldUpdateRules.call(
 									this,
@@ -522,6 +492,8 @@ export async function execute(
 			}
 		}
 
+			syncTableRecords((responseData.records as IDataObject[]) || []);
+
 						let dataToWrap = responseData.records as IDataObject[];
 
 			// Apply field renaming
@@ -1,5 +1,5 @@
 import type { IDataObject, IExecuteFunctions } from 'n8n-workflow';
-import { getTableSchema } from './linkedRecordUtils';
+import { getFieldClassification, getTableSchema } from './linkedRecordUtils';
 
 export interface ArrayHandlingOptions {
 	arrayMergeStrategy: 'replace' | 'append' | 'union';
@@ -21,6 +21,11 @@ export async function detectArrayFields(
 	tableId: string,
 ): Promise<ArrayFieldInfo[]> {
 	const { allFields } = await getTableSchema.call(this, base, tableId);
+
+	return getFieldClassification(allFields, 'arrayFields', findArrayFields);
+}
+
+function findArrayFields(allFields: IDataObject[]): ArrayFieldInfo[] {
 	const arrayFields: ArrayFieldInfo[] = [];
 
 	for (const field of allFields) {
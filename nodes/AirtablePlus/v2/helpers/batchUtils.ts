@@ -0,0 +1,112 @@
+import type { IExecuteFunctions, INodeExecutionData, NodeApiError } from 'n8n-workflow';
+
+import { processAirtableError } from './utils';
+
+// Airtable accepts at most 10 records per create or update request
+export const BATCH_SIZE = 10;
+
+export interface QueuedWrite {
+	itemIndex: number;
+	recordId?: string;
+	recordCount?: number;
+}
+
+interface BatchedWriteHandlers<T extends QueuedWrite> {
+	writeBatch: (batch: T[], typecast: boolean) => Promise<void>;
+	writeItem: (write: T, typecast: boolean) => Promise<void>;
+}
+
+/**
+ * Only a rejected record (HTTP 422 / INVALID_*) fails a batch in a way that replaying
+ * item by item can tell apart, rate limits and server errors would only fail again
+ */
+export function isValidationError(error: NodeApiError) {
+	if (String(error.httpCode) === '422') {
+		return true;
+	}
+
+	const type = (error.description || error.message || '') as string;
+	return type.startsWith('INVALID_');
+}
+
+/**
+ * Queues consecutive writes and sends them together, up to 10 records per request.
+ * A batch rejected on validation is replayed item by item so each item reports
+ * its own error, any other failure is kept unchanged in `failure`.
+ */
+export function createBatchedWriter<T extends QueuedWrite>(
+	context: IExecuteFunctions,
+	results: INodeExecutionData[][],
+	{ writeBatch, writeItem }: BatchedWriteHandlers<T>,
+) {
+	let pending: T[] = [];
+	let pendingCount = 0;
+	let pendingTypecast = false;
+	let failure: NodeApiError | undefined;
+
+	const flush = async () => {
+		const batch = pending;
+		pending = [];
+		pendingCount = 0;
+
+		if (failure || !batch.length) return;
+
+		const typecast = pendingTypecast;
+
+		if (batch.length > 1) {
+			try {
+				await writeBatch(batch, typecast);
+				return;
+			} catch (error) {
+				if (!isValidationError(error as NodeApiError)) {
+					failure = error as NodeApiError;
+					return;
+				}
+				// One bad record fails the whole batch, replay item by item so errors are reported as before
+			}
+		}
+
+		for (const write of batch) {
+			try {
+				await writeItem(write, typecast);
+			} catch (error) {
+				error = processAirtableError(error as NodeApiError, write.recordId, write.itemIndex);
+				if (context.continueOnFail()) {
+					results[write.itemIndex] = [{ json: { message: error.message, error } }];
+					continue;
+				}
+				failure = error;
+				return;
+			}
+		}
+	};
+
+	return {
+		get failure() {
+			return failure;
+		},
+
+		flush,
+
+		/** Queues a write, sending the queue first if the write cannot join it */
+		async add(write: T, typecast: boolean) {
+			const recordCount = write.recordCount ?? 1;
+			if (pending.length && (typecast !== pendingTypecast || pendingCount + recordCount > BATCH_SIZE)) {
+				await flush();
+				if (failure) return;
+			}
+
+			pending.push(write);
+			pendingCount += recordCount;
+			pendingTypecast = typecast;
+		},
+
+		/** Sends whatever is still queued and raises the failure of any batch */
+		async finish() {
+			await flush();
+			if (failure) {
+				throw failure;
+			}
+		},
+	};
+}
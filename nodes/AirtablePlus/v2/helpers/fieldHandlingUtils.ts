@@ -1,6 +1,6 @@
 import type { IDataObject, IExecuteFunctions } from 'n8n-workflow';
 import { ApplicationError } from 'n8n-workflow';
-import { getTableSchema } from './linkedRecordUtils';
+import { getFieldClassification, getTableSchema } from './linkedRecordUtils';
 import type { FieldUpdateRule, FieldUpdateStrategy } from './interfaces';
 
 export interface FieldInfo {
@@ -24,6 +24,11 @@ export async function detectAllFields(
 	tableId: string,
 ): Promise<FieldInfo[]> {
 	const { allFields } = await getTableSchema.call(this, base, tableId);
+
+	return getFieldClassification(allFields, 'fieldInfo', categorizeFields);
+}
+
+function categorizeFields(allFields: IDataObject[]): FieldInfo[] {
 	const fields: FieldInfo[] = [];
 
 	for (const field of allFields) {
@@ -82,12 +87,6 @@ export async function processFieldValue(
 			const hasExistingValue = existingValue !== null && existingValue !== undefined && existingValue !== '' &&
 			    !(Array.isArray(existingValue) && existingValue.length === 0);
 
-			console.log(`🔍 preserveExisting logic for "${fieldName}":`, {
-				existingValue,
-				hasExistingValue,
-				willUpdate: !hasExistingValue
-			});
-
 			if (hasExistingValue) {
 				return {
 					shouldUpdate: false,
@@ -287,16 +286,8 @@ export async function processFieldUpdateRules(
 	existingFields: IDataObject | null,
 	fieldUpdateRules: FieldUpdateRule[],
 ): Promise<IDataObject> {
-	console.log('🔍 processFieldUpdateRules called with:', {
-		fieldsCount: Object.keys(newFields).length,
-		rulesCount: fieldUpdateRules.length,
-		hasExistingFields: !!existingFields,
-		rules: fieldUpdateRules.map(r => ({ fields: r.fieldNames, strategy: r.strategy }))
-	});
-
 	// If no rules or no existing fields, return as-is
 	if (!fieldUpdateRules.length || !existingFields) {
-		console.log('🚫 Early return - no rules or existing fields');
 		return newFields;
 	}
 
@@ -312,13 +303,6 @@ export async function processFieldUpdateRules(
 	for (const [fieldName, newValue] of Object.entries(newFields)) {
 		const rule = getFieldUpdateRule(fieldName, fieldUpdateRules);
 
-		console.log(`🔍 Processing field "${fieldName}":`, {
-			newValue,
-			existingValue: existingFields[fieldName],
-			hasRule: !!rule,
-			strategy: rule?.strategy
-		});
-
 		if (rule) {
 			// Apply custom strategy for this field
 			const fieldInfo = fieldInfoMap.get(fieldName);
@@ -333,31 +317,18 @@ export async function processFieldUpdateRules(
 					fieldInfo,
 				);
 
-				console.log(`✅ Field "${fieldName}" result:`, {
-					shouldUpdate: result.shouldUpdate,
-					processedValue: result.processedValue
-				});
-
 				if (result.shouldUpdate) {
 					processedFields[fieldName] = result.processedValue;
 				}
 			} else {
 				// Field not found in schema, use default behavior
-				console.log(`⚠️ Field "${fieldName}" not found in schema, using default`);
 				processedFields[fieldName] = newValue;
 			}
 		} else {
 			// No custom rule, use default replace behavior
-			console.log(`📝 Field "${fieldName}" no custom rule, using default`);
 			processedFields[fieldName] = newValue;
 		}
 	}
 
-	console.log('🏁 processFieldUpdateRules result:', {
-		originalCount: Object.keys(newFields).length,
-		processedCount: Object.keys(processedFields).length,
-		processedFields
-	});
-
 	return processedFields;
 }
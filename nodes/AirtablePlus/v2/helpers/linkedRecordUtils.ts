@@ -35,6 +35,41 @@ export function getExpandableFields(
 	);
 }
 
+/**
+ * Base schema responses per node execution, so every item and helper that needs the
+ * schema of the same base shares a single `meta/bases/{base}/tables` request
+ */
+const baseSchemaCache = new WeakMap<IExecuteFunctions, Map<string, Promise<IDataObject>>>();
+
+/**
+ * Gets the tables schema of a base, fetching it at most once per node execution
+ */
+async function getBaseSchema(this: IExecuteFunctions, base: string): Promise<IDataObject> {
+	const executionCache = baseSchemaCache.get(this) || new Map<string, Promise<IDataObject>>();
+	baseSchemaCache.set(this, executionCache);
+
+	let schema = executionCache.get(base);
+	if (!schema) {
+		schema = apiRequest.call(this, 'GET', `meta/bases/${base}/tables`);
+		executionCache.set(base, schema);
+		// Don't keep failed requests around, so a later call can retry
+		schema.catch(() => executionCache.delete(base));
+	}
+
+	return await schema;
+}
+
+interface TableSchema {
+	linkedFields: LinkedFieldInfo[];
+	allFields: IDataObject[];
+}
+
+/**
+ * Table schemas derived from a base schema response, keyed on that response so they
+ * are worked out once per table instead of on every record that needs them
+ */
+const tableSchemaCache = new WeakMap<IDataObject, Map<string, TableSchema>>();
+
 /**
  * Gets schema information for a table and identifies linked record fields
  */
@@ -42,12 +77,28 @@ export async function getTableSchema(
 	this: IExecuteFunctions,
 	base: string,
 	tableId: string,
-): Promise<{ linkedFields: LinkedFieldInfo[]; allFields: IDataObject[] }> {
-	const response = await apiRequest.call(this, 'GET', `meta/bases/${base}/tables`);
+): Promise<TableSchema> {
+	const response = await getBaseSchema.call(this, base);
 
-	const tableData = ((response.tables as IDataObject[]) || []).find((table: IDataObject) => {
-		return table.id === tableId;
-	});
+	let tableSchemas = tableSchemaCache.get(response);
+	if (!tableSchemas) {
+		tableSchemas = new Map<string, TableSchema>();
+		tableSchemaCache.set(response, tableSchemas);
+	}
+
+	const cachedSchema = tableSchemas.get(tableId);
+	if (cachedSchema) {
+		return cachedSchema;
+	}
+
+	const tablesById = new Map<string, IDataObject>();
+	for (const table of (response.tables as IDataObject[]) || []) {
+		if (!tablesById.has(table.id as string)) {
+			tablesById.set(table.id as string, table);
+		}
+	}
+
+	const tableData = tablesById.get(tableId);
 
 	if (!tableData) {
 		throw new Error(`Table ${tableId} not found in base ${base}`);
@@ -72,9 +123,7 @@ export async function getTableSchema(
 
 			if (linkedTableId) {
 				// Find the linked table name for better debugging
-				const linkedTable = ((response.tables as IDataObject[]) || []).find((table: IDataObject) => {
-					return table.id === linkedTableId;
-				});
+				const linkedTable = tablesById.get(linkedTableId);
 
 				linkedFields.push({
 					fieldName: field.name as string,
@@ -87,7 +136,30 @@ export async function getTableSchema(
 
 	console.log(`DEBUG: Found ${linkedFields.length} linked fields:`, linkedFields.map(f => f.fieldName));
 
-	return { linkedFields, allFields };
+	const tableSchema = { linkedFields, allFields };
+	tableSchemas.set(tableId, tableSchema);
+
+	return tableSchema;
+}
+
+const fieldClassificationCache = new WeakMap<IDataObject[], Map<string, unknown>>();
+
+/** Classifies a table's schema fields once per schema, reusing the result for every record */
+export function getFieldClassification<T>(
+	allFields: IDataObject[],
+	kind: string,
+	classify: (allFields: IDataObject[]) => T,
+): T {
+	let classifications = fieldClassificationCache.get(allFields);
+	if (!classifications) {
+		classifications = new Map<string, unknown>();
+		fieldClassificationCache.set(allFields, classifications);
+	}
+
+	if (!classifications.has(kind)) {
+		classifications.set(kind, classify(allFields));
+	}
+	return classifications.get(kind) as T;
 }
 
 /**
@@ -144,7 +216,6 @@ export async function fetchLinkedRecords(
 		const batch = recordIds.slice(i, i + batchSize);
 
 		// Create a formula to get specific records by ID
-		const recordIdsList = batch.map(id => `"${id}"`).join(',');
 		const filterFormula = `OR(${batch.map(id => `RECORD_ID() = "${id}"`).join(',')})`;
 
 		const qs = {
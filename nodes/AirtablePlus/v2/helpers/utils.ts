@@ -7,18 +7,14 @@ import { apiRequest } from '../transport';
 
 export function removeIgnored(data: IDataObject, ignore: string | string[]) {
 	if (ignore) {
-		let ignoreFields: string[] = [];
-
-		if (typeof ignore === 'string') {
-			ignoreFields = ignore.split(',').map((field) => field.trim());
-		} else {
-			ignoreFields = ignore;
-		}
+		const ignoreFields = new Set(
+			typeof ignore === 'string' ? ignore.split(',').map((field) => field.trim()) : ignore,
+		);
 
 		const newData: IDataObject = {};
 
 		for (const field of Object.keys(data)) {
-			if (!ignoreFields.includes(field)) {
+			if (!ignoreFields.has(field)) {
 				newData[field] = data[field];
 			}
 		}
@@ -45,34 +41,51 @@ export function removeEmptyFields(data: IDataObject) {
 	return newData;
 }
 
+/**
+ * Builds the lookup key used to match records on the given columns.
+ * Null, undefined and empty string are treated as the same (empty) value.
+ */
+function getMatchKey(keys: string[], fields: IDataObject) {
+	return JSON.stringify(
+		keys.map((key) => {
+			const value = fields[key];
+			return value === null || value === undefined || value === '' ? null : String(value);
+		}),
+	);
+}
+
+/**
+ * Indexes records by the values of the matching columns so that
+ * findMatches can look up candidates without scanning the whole table
+ */
+export function indexRecordsByKeys(data: UpdateRecord[], keys: string[]) {
+	const index = new Map<string, UpdateRecord[]>();
+
+	for (const record of data) {
+		const matchKey = getMatchKey(keys, record.fields);
+		const bucket = index.get(matchKey);
+		if (bucket) {
+			bucket.push(record);
+		} else {
+			index.set(matchKey, [record]);
+		}
+	}
+
+	return index;
+}
+
 export function findMatches(
 	data: UpdateRecord[],
 	keys: string[],
 	fields: IDataObject,
 	updateAll?: boolean,
+	index?: Map<string, UpdateRecord[]>,
 ) {
-	// Enhanced matching logic that handles null values more flexibly
-	const matchingRecords = data.filter((record) => {
-		return keys.every(key => {
-			const inputValue = fields[key];
-			const recordValue = record.fields[key];
-
-			// Both null/undefined/empty - consider a match
-			if ((inputValue === null || inputValue === undefined || inputValue === '') &&
-				(recordValue === null || recordValue === undefined || recordValue === '')) {
-				return true;
-			}
-
-			// Both have values - must be equal
-			if (inputValue !== null && inputValue !== undefined && inputValue !== '' &&
-				recordValue !== null && recordValue !== undefined && recordValue !== '') {
-				return String(inputValue) === String(recordValue);
-			}
-
-			// One null, one has value - not a match
-			return false;
-		});
-	});
+	// Null/undefined/empty values match each other, anything else must be equal as a string
+	const inputKey = getMatchKey(keys, fields);
+	const matchingRecords = index
+		? index.get(inputKey) || []
+		: data.filter((record) => getMatchKey(keys, record.fields) === inputKey);
 
 	if (updateAll) {
 		if (!matchingRecords?.length) {
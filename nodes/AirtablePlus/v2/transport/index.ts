@@ -106,21 +106,35 @@ export async function downloadRecordAttachments(
 			element.pairedItem = pairedItem;
 		}
 		element.json = flattenOutput(record as unknown as IDataObject);
+
+		// Attachment downloads are independent (and served from Airtable's file URLs, not the
+		// rate-limited API), so fetch all of a record's attachments concurrently
+		const downloads: Array<Promise<[string, IBinaryKeyData[string]]>> = [];
 		for (const fieldName of fieldNames) {
 			if (record.fields[fieldName] !== undefined) {
 				for (const [index, attachment] of (record.fields[fieldName] as IAttachment[]).entries()) {
-					const file = await apiRequest.call(this, 'GET', '', {}, {}, attachment.url, {
-						json: false,
-						encoding: null,
-					});
-					element.binary![`${fieldName}_${index}`] = await this.helpers.prepareBinaryData(
-						Buffer.from(file as string),
-						attachment.filename,
-						attachment.type,
+					downloads.push(
+						(async (): Promise<[string, IBinaryKeyData[string]]> => {
+							const file = await apiRequest.call(this, 'GET', '', {}, {}, attachment.url, {
+								json: false,
+								encoding: null,
+							});
+							const binaryData = await this.helpers.prepareBinaryData(
+								Buffer.from(file as string),
+								attachment.filename,
+								attachment.type,
+							);
+							return [`${fieldName}_${index}`, binaryData];
+						})(),
 					);
 				}
 			}
 		}
+
+		// Assign in field/attachment order so binary keys keep their previous order
+		for (const [binaryKey, binaryData] of await Promise.all(downloads)) {
+			element.binary![binaryKey] = binaryData;
+		}
 		if (Object.keys(element.binary as IBinaryKeyData).length === 0) {
 			delete element.binary;
 		}
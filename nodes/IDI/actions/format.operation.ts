@@ -141,9 +141,66 @@ export const description: INodeProperties[] = [
 	},
 ];
 
+// Supported date formats in one pattern: MM/DD/YYYY, MM/DD/YY, YYYY-MM-DD
+const DATE_PATTERN = /^(?:(\d{1,2})\/(\d{1,2})\/(\d{4}|\d{2})|(\d{4})-(\d{1,2})-(\d{1,2}))$/;
+
+// Street suffixes checked in order when splitting a street into its components
+const STREET_SUFFIXES = ['ST', 'STREET', 'AVE', 'AVENUE', 'RD', 'ROAD', 'LN', 'LANE', 'DR', 'DRIVE', 'CT', 'COURT', 'BLVD', 'BOULEVARD', 'PL', 'PLACE'];
+
+// Basic gender guessing - you could expand this with a larger name database
+const MALE_NAMES = ['james', 'john', 'robert', 'michael', 'william', 'david', 'richard', 'joseph', 'thomas', 'daniel'];
+const FEMALE_NAMES = ['mary', 'patricia', 'jennifer', 'linda', 'elizabeth', 'barbara', 'susan', 'jessica', 'sarah', 'karen'];
+const SEX_BY_NAME = new Map<string, string>([
+	...MALE_NAMES.map((name): [string, string] => [name, 'M']),
+	...FEMALE_NAMES.map((name): [string, string] => [name, 'F']),
+]);
+
+// Column names for the searched person (primary contact and address)
+const PRIMARY_COLUMNS = {
+	firstName: 'INPUT: First Name',
+	lastName: 'INPUT: Last Name',
+	age: 'DOB: Age',
+	phone: 'PH: Phone1',
+	deceased: 'DEC: Deceased (Y/N/U)',
+	bankruptcy: 'BNK: Bankrupt (Y/N/U)',
+	address: 'ADD: Address1',
+	city: 'ADD: Address1 City',
+	state: 'ADD: Address1 State',
+	zip: 'ADD: Address1 Zip',
+	county: 'ADD: Address1 County',
+	firstSeen: 'ADD: Address1 First Seen',
+	lastSeen: 'ADD: Address1 Last Seen',
+};
+
+// Column names for the REL1-REL5 relative blocks, built once instead of per row
+const RELATIVE_COLUMNS = [1, 2, 3, 4, 5].map((i) => ({
+	firstName: `REL${i}: First Name`,
+	lastName: `REL${i}: Last Name`,
+	middleName: `REL${i}: Middle Name`,
+	age: `REL${i}: Age`,
+	phone: `REL${i}: Phone 1`,
+	email: `REL${i}: Email 1`,
+	relationship: `REL${i}: Likely Relationship`,
+	address: `REL${i}: Address`,
+	city: `REL${i}: City`,
+	state: `REL${i}: State`,
+	zip: `REL${i}: Zip`,
+}));
+
+// Every CSV column processIDIRow reads - other columns are not copied into row records
+const IDI_CSV_COLUMNS = new Set<string>([
+	...Object.values(PRIMARY_COLUMNS),
+	...RELATIVE_COLUMNS.flatMap((columns) => Object.values(columns)),
+]);
+
 class IDIToContactsConverter {
 	private contactIdCounter: number = 1;
 	private addressIdCounter: number = 1;
+	// "Now" is effectively constant for one conversion run, so read the clock once
+	private readonly createdTime: string = new Date().toISOString();
+	private readonly currentYear: number = new Date().getFullYear();
+	// First, middle and last names repeat heavily across rows, so each spelling is cleaned once
+	private readonly cleanedNames = new Map<string, string>();
 
 	generateContactId(): string {
 		return `rec${this.generateRandomString(14)}`;
@@ -163,44 +220,47 @@ class IDIToContactsConverter {
 	}
 
 	cleanName(name: string): string {
-		if (!name || name.trim() === '') {
+		if (!name) {
 			return '';
 		}
-		return name.trim().split(' ').map(word =>
-			word.charAt(0).toUpperCase() + word.slice(1).toLowerCase()
-		).join(' ');
+
+		let cleaned = this.cleanedNames.get(name);
+		if (cleaned === undefined) {
+			const trimmed = name.trim();
+			cleaned = trimmed === '' ? '' : trimmed.split(' ').map(word =>
+				word.charAt(0).toUpperCase() + word.slice(1).toLowerCase()
+			).join(' ');
+			this.cleanedNames.set(name, cleaned);
+		}
+		return cleaned;
 	}
 
 	parseDate(dateStr: string): string | null {
-		if (!dateStr || dateStr.trim() === '') {
+		const trimmed = dateStr ? dateStr.trim() : '';
+		if (trimmed === '') {
 			return null;
 		}
 
 		try {
-			// Try different date formats
-			const formats = [
-				/^(\d{1,2})\/(\d{1,2})\/(\d{4})$/, // MM/DD/YYYY
-				/^(\d{1,2})\/(\d{1,2})\/(\d{2})$/, // MM/DD/YY
-				/^(\d{4})-(\d{1,2})-(\d{1,2})$/,  // YYYY-MM-DD
-			];
-
-			for (const format of formats) {
-				const match = dateStr.trim().match(format);
-				if (match) {
-					let year: number, month: number, day: number;
-
-					if (format === formats[2]) { // YYYY-MM-DD
-						[, year, month, day] = match.map(Number);
-					} else { // MM/DD/YYYY or MM/DD/YY
-						[, month, day, year] = match.map(Number);
-						if (year < 100) { // 2-digit year
-							year += year > 50 ? 1900 : 2000;
-						}
+			const match = trimmed.match(DATE_PATTERN);
+			if (match) {
+				let year: number, month: number, day: number;
+
+				if (match[4]) { // YYYY-MM-DD
+					year = Number(match[4]);
+					month = Number(match[5]);
+					day = Number(match[6]);
+				} else { // MM/DD/YYYY or MM/DD/YY
+					month = Number(match[1]);
+					day = Number(match[2]);
+					year = Number(match[3]);
+					if (year < 100) { // 2-digit year
+						year += year > 50 ? 1900 : 2000;
 					}
-
-					const date = new Date(year, month - 1, day);
-					return date.toISOString();
 				}
+
+				const date = new Date(year, month - 1, day);
+				return date.toISOString();
 			}
 		} catch (error) {
 			// Invalid date, return null
@@ -210,14 +270,15 @@ class IDIToContactsConverter {
 	}
 
 	ynToBool(ynValue: string): boolean {
-		return ynValue?.trim().toUpperCase() === 'Y';
+		const value = ynValue?.trim();
+		return value === 'Y' || value === 'y';
 	}
 
 	calculateBirthYear(ageStr: string): number | null {
 		try {
 			const age = parseInt(ageStr);
 			if (age > 0) {
-				return new Date().getFullYear() - age;
+				return this.currentYear - age;
 			}
 		} catch (error) {
 			// Invalid age
@@ -253,18 +314,7 @@ class IDIToContactsConverter {
 			return 'U';
 		}
 
-		// Basic gender guessing - you could expand this with a larger name database
-		const maleNames = ['james', 'john', 'robert', 'michael', 'william', 'david', 'richard', 'joseph', 'thomas', 'daniel'];
-		const femaleNames = ['mary', 'patricia', 'jennifer', 'linda', 'elizabeth', 'barbara', 'susan', 'jessica', 'sarah', 'karen'];
-
-		const nameLower = firstName.toLowerCase();
-		if (maleNames.includes(nameLower)) {
-			return 'M';
-		} else if (femaleNames.includes(nameLower)) {
-			return 'F';
-		}
-
-		return 'U';
+		return SEX_BY_NAME.get(firstName.toLowerCase()) || 'U';
 	}
 
 	createAddressRecord(
@@ -290,12 +340,11 @@ class IDIToContactsConverter {
 			if (parts.length > 0 && /^\d+/.test(parts[0])) {
 				streetNumber = parts[0].replace(/,/g, '');
 				const remaining = parts.slice(1).join(' ');
+				const remainingUpper = remaining.toUpperCase();
 
 				// Simple suffix detection
-				const suffixes = ['ST', 'STREET', 'AVE', 'AVENUE', 'RD', 'ROAD', 'LN', 'LANE', 'DR', 'DRIVE', 'CT', 'COURT', 'BLVD', 'BOULEVARD', 'PL', 'PLACE'];
-
-				for (const suffix of suffixes) {
-					if (remaining.toUpperCase().endsWith(suffix)) {
+				for (const suffix of STREET_SUFFIXES) {
+					if (remainingUpper.endsWith(suffix)) {
 						streetSuffix = suffix;
 						streetName = remaining.slice(0, -suffix.length).trim();
 						break;
@@ -314,7 +363,7 @@ class IDIToContactsConverter {
 
 		const addressRecord: IAddressRecord = {
 			id: addressId,
-			createdTime: new Date().toISOString(),
+			createdTime: this.createdTime,
 			Address: fullAddress,
 			'Street 1': street,
 			City: city,
@@ -390,7 +439,7 @@ class IDIToContactsConverter {
 		// Create contact record
 		const contact: IContactRecord = {
 			id: contactId,
-			createdTime: new Date().toISOString(),
+			createdTime: this.createdTime,
 			Contact: displayName,
 			'Entity Type': 'Person',
 			'First Name': firstClean,
@@ -452,31 +501,31 @@ class IDIToContactsConverter {
 
 		// Create primary contact (the searched person)
 		const primaryContact = this.createContactRecord(
-			(row['INPUT: First Name'] as string) || '',
-			(row['INPUT: Last Name'] as string) || '',
+			(row[PRIMARY_COLUMNS.firstName] as string) || '',
+			(row[PRIMARY_COLUMNS.lastName] as string) || '',
 			'', // No middle name in input data
-			(row['DOB: Age'] as string) || '',
-			(row['PH: Phone1'] as string) || '',
+			(row[PRIMARY_COLUMNS.age] as string) || '',
+			(row[PRIMARY_COLUMNS.phone] as string) || '',
 			'', // No email in primary
 			'Owner',
-			(row['DEC: Deceased (Y/N/U)'] as string) || '',
-			(row['BNK: Bankrupt (Y/N/U)'] as string) || ''
+			(row[PRIMARY_COLUMNS.deceased] as string) || '',
+			(row[PRIMARY_COLUMNS.bankruptcy] as string) || ''
 		);
 
 		contacts.push(primaryContact);
 
 		// Create primary address if available
-		const primaryAddressStreet = (row['ADD: Address1'] as string) || '';
+		const primaryAddressStreet = (row[PRIMARY_COLUMNS.address] as string) || '';
 		if (primaryAddressStreet) {
 			const primaryAddress = this.createAddressRecord(
 				primaryAddressStreet,
-				(row['ADD: Address1 City'] as string) || '',
-				(row['ADD: Address1 State'] as string) || '',
-				(row['ADD: Address1 Zip'] as string) || '',
-				(row['ADD: Address1 County'] as string) || '',
+				(row[PRIMARY_COLUMNS.city] as string) || '',
+				(row[PRIMARY_COLUMNS.state] as string) || '',
+				(row[PRIMARY_COLUMNS.zip] as string) || '',
+				(row[PRIMARY_COLUMNS.county] as string) || '',
 				'Contact',
-				(row['ADD: Address1 First Seen'] as string) || '',
-				(row['ADD: Address1 Last Seen'] as string) || ''
+				(row[PRIMARY_COLUMNS.firstSeen] as string) || '',
+				(row[PRIMARY_COLUMNS.lastSeen] as string) || ''
 			);
 
 			primaryAddress.Contacts.push(primaryContact.id);
@@ -486,20 +535,20 @@ class IDIToContactsConverter {
 
 		// Process relatives (REL1-REL5) if enabled
 		if (includeRelatives) {
-			for (let i = 1; i <= 5; i++) {
-				const relFirst = (row[`REL${i}: First Name`] as string) || '';
-				const relLast = (row[`REL${i}: Last Name`] as string) || '';
+			for (const columns of RELATIVE_COLUMNS) {
+				const relFirst = (row[columns.firstName] as string) || '';
+				const relLast = (row[columns.lastName] as string) || '';
 
 				if (relFirst && relLast) {
 					// Create relative contact
 					const relativeContact = this.createContactRecord(
 						relFirst,
 						relLast,
-						(row[`REL${i}: Middle Name`] as string) || '',
-						(row[`REL${i}: Age`] as string) || '',
-						(row[`REL${i}: Phone 1`] as string) || '',
-						(row[`REL${i}: Email 1`] as string) || '',
-						(row[`REL${i}: Likely Relationship`] as string) || ''
+						(row[columns.middleName] as string) || '',
+						(row[columns.age] as string) || '',
+						(row[columns.phone] as string) || '',
+						(row[columns.email] as string) || '',
+						(row[columns.relationship] as string) || ''
 					);
 
 					// Link relatives bidirectionally
@@ -509,10 +558,10 @@ class IDIToContactsConverter {
 					contacts.push(relativeContact);
 
 					// Create relative address if available
-					const relAddress = (row[`REL${i}: Address`] as string) || '';
-					const relCity = (row[`REL${i}: City`] as string) || '';
-					const relState = (row[`REL${i}: State`] as string) || '';
-					const relZip = (row[`REL${i}: Zip`] as string) || '';
+					const relAddress = (row[columns.address] as string) || '';
+					const relCity = (row[columns.city] as string) || '';
+					const relState = (row[columns.state] as string) || '';
+					const relZip = (row[columns.zip] as string) || '';
 
 					if (relAddress) {
 						const relativeAddress = this.createAddressRecord(
@@ -545,13 +594,11 @@ function embedAddressData(contacts: IContactRecord[], addresses: IAddressRecord[
 		addressMap.set(address.id, address);
 	});
 
-	// Process each contact and embed address data
-	return contacts.map(contact => {
-		const updatedContact = { ...contact };
-
+	// Embed address data in place - the contacts were just built for this row, so there is no need to copy them
+	for (const contact of contacts) {
 		// Replace Contact Addresses references with embedded objects
 		if (contact['Contact Addresses'] && Array.isArray(contact['Contact Addresses'])) {
-			updatedContact['Contact Addresses'] = contact['Contact Addresses'].map(addressId => {
+			contact['Contact Addresses'] = contact['Contact Addresses'].map(addressId => {
 				const address = addressMap.get(addressId);
 				if (address) {
 					// Return embedded address object (without the reverse Contacts reference to avoid circular data)
@@ -561,53 +608,80 @@ function embedAddressData(contacts: IContactRecord[], addresses: IAddressRecord[
 				return addressId; // Fallback to ID if address not found
 			});
 		}
+	}
 
-		return updatedContact;
-	});
+	return contacts;
 }
 
 // Helper function to parse CSV - handles quoted fields and commas within quotes
-function parseCSV(csvData: string): any[] {
-	const lines = csvData.split('\n');
-	if (lines.length < 2) return [];
+// Yields one record at a time so rows can be converted as they are parsed
+function* parseCSV(csvData: string, columns?: Set<string>): Generator<any> {
+	// Walk the content line by line instead of splitting it into one large array up front
+	let lineStart = 0;
+	function nextLine(): string | undefined {
+		if (lineStart > csvData.length) return undefined;
+		let lineEnd = csvData.indexOf('\n', lineStart);
+		if (lineEnd === -1) lineEnd = csvData.length;
+		const line = csvData.slice(lineStart, lineEnd);
+		lineStart = lineEnd + 1;
+		return line;
+	}
+
+	const headerLine = nextLine();
+	if (headerLine === undefined || lineStart > csvData.length) return;
 
 	// Parse CSV line handling quotes and commas within quotes
 	function parseLine(line: string): string[] {
+		// Fast path: without quotes every comma is a separator
+		if (line.indexOf('"') === -1) {
+			return line.split(',').map(value => value.trim());
+		}
+
 		const result = [];
 		let current = '';
+		let segmentStart = 0;
 		let inQuotes = false;
 
+		// Copy the text between quotes and separators in slices rather than one character at a time
 		for (let i = 0; i < line.length; i++) {
 			const char = line[i];
 
 			if (char === '"') {
+				current += line.slice(segmentStart, i);
+				segmentStart = i + 1;
 				inQuotes = !inQuotes;
 			} else if (char === ',' && !inQuotes) {
+				current += line.slice(segmentStart, i);
+				segmentStart = i + 1;
 				result.push(current.trim());
 				current = '';
-			} else {
-				current += char;
 			}
 		}
+		current += line.slice(segmentStart);
 		result.push(current.trim());
 		return result;
 	}
 
-	const headers = parseLine(lines[0]);
-	const records = [];
+	const headers = parseLine(headerLine);
 
-	for (let i = 1; i < lines.length; i++) {
-		if (lines[i].trim()) {
-			const values = parseLine(lines[i]);
-			const record: any = {};
-			headers.forEach((header, index) => {
-				record[header] = values[index] || '';
-			});
-			records.push(record);
+	// Resolve the positions of the wanted columns once from the header row
+	const columnIndexes: number[] = [];
+	for (let index = 0; index < headers.length; index++) {
+		if (!columns || columns.has(headers[index])) {
+			columnIndexes.push(index);
 		}
 	}
 
-	return records;
+	for (let line = nextLine(); line !== undefined; line = nextLine()) {
+		if (line.trim()) {
+			const values = parseLine(line);
+			const record: any = {};
+			for (const index of columnIndexes) {
+				record[headers[index]] = values[index] || '';
+			}
+			yield record;
+		}
+	}
 }
 
 export async function execute(
@@ -634,25 +708,34 @@ export async function execute(
 		}
 
 		const binaryData = item.binary[binaryPropertyName];
-		const csvContent = Buffer.from(binaryData.data, 'base64').toString('utf-8');
+		// Read through the binary helper so filesystem-backed data is not round-tripped through base64
+		const csvBuffer = await this.helpers.getBinaryDataBuffer(index, binaryPropertyName);
+		const csvContent = csvBuffer.toString('utf-8');
 
-		// Parse CSV and process each row
-		const csvRows = parseCSV(csvContent);
+		// Parse CSV and process each row as it is read, so parsed rows don't all stay in memory
+		// The row count is only known at the end, so totalRows is filled in after the loop
+		const rowMetadataObjects: IDataObject[] = [];
+		let rowIndex = 0;
 
-		for (let rowIndex = 0; rowIndex < csvRows.length; rowIndex++) {
-			const row = csvRows[rowIndex];
+		// Settings that are the same for every row
+		const originalFileName = binaryData.fileName || 'unknown.csv';
+		const embedAddresses = addressDataFormat === 'embedded' && (outputFormat === 'contacts' || outputFormat === 'both');
+
+		for (const row of parseCSV(csvContent, IDI_CSV_COLUMNS)) {
 			const result = converter.processIDIRow(row, includeRelatives);
 
 			// Add metadata to track which CSV row this came from
 			const rowMetadata = {
 				csvRowIndex: rowIndex + 1, // 1-based for user friendliness
-				totalRows: csvRows.length,
-				originalFileName: binaryData.fileName || 'unknown.csv',
+				totalRows: 0,
+				originalFileName,
 			};
+			rowMetadataObjects.push(rowMetadata);
+			rowIndex++;
 
 			// Apply address data format if needed
 			let finalContacts = result.contacts;
-			if (addressDataFormat === 'embedded' && (outputFormat === 'contacts' || outputFormat === 'both')) {
+			if (embedAddresses) {
 				finalContacts = embedAddressData(result.contacts, result.addresses);
 			}
 
@@ -660,11 +743,9 @@ export async function execute(
 			switch (outputFormat) {
 				case 'contacts':
 					finalContacts.forEach((contact, contactIndex) => {
+						contact._metadata = rowMetadata;
 						returnData.push({
-							json: {
-								...contact,
-								_metadata: rowMetadata,
-							},
+							json: contact,
 							pairedItem: { item: index },
 						});
 					});
@@ -672,42 +753,46 @@ export async function execute(
 
 				case 'addresses':
 					result.addresses.forEach((address, addressIndex) => {
+						address._metadata = rowMetadata;
 						returnData.push({
-							json: {
-								...address,
-								_metadata: rowMetadata,
-							},
+							json: address,
 							pairedItem: { item: index },
 						});
 					});
 					break;
 
 				case 'both':
-				default:
+				default: {
+					// Records from the same row share their metadata objects
+					const contactMetadata = { ...rowMetadata, recordType: 'contact' };
+					const addressMetadata = { ...rowMetadata, recordType: 'address' };
+					rowMetadataObjects.push(contactMetadata, addressMetadata);
+
 					// Add all contacts first
 					finalContacts.forEach((contact, contactIndex) => {
+						contact._metadata = contactMetadata;
 						returnData.push({
-							json: {
-								...contact,
-								_metadata: { ...rowMetadata, recordType: 'contact' },
-							},
+							json: contact,
 							pairedItem: { item: index },
 						});
 					});
 
 					// Then add all addresses
 					result.addresses.forEach((address, addressIndex) => {
+						address._metadata = addressMetadata;
 						returnData.push({
-							json: {
-								...address,
-								_metadata: { ...rowMetadata, recordType: 'address' },
-							},
+							json: address,
 							pairedItem: { item: index },
 						});
 					});
 					break;
+				}
 			}
 		}
+
+		for (const metadata of rowMetadataObjects) {
+			metadata.totalRows = rowIndex;
+		}
 	} else {
 		// Process single JSON row (original behavior)
 		const result = converter.processIDIRow(item.json, includeRelatives);
@@ -742,22 +827,18 @@ export async function execute(
 			default:
 				// Add all contacts first
 				finalContacts.forEach(contact => {
+					contact._metadata = { recordType: 'contact' };
 					returnData.push({
-						json: {
-							...contact,
-							_metadata: { recordType: 'contact' },
-						},
+						json: contact,
 						pairedItem: { item: index },
 					});
 				});
 
 				// Then add all addresses
 				result.addresses.forEach(address => {
+					address._metadata = { recordType: 'address' };
 					returnData.push({
-						json: {
-							...address,
-							_metadata: { recordType: 'address' },
-						},
+						json: address,
 						pairedItem: { item: index },
 					});
 				});
@@ -2121,8 +2121,8 @@ export async function execute(
 		}
 
 		// Process binary data for image fields before returning items
-		const globalBinaryData: { [key: string]: any } = {};
-		let hasBinaryData = false;
+		// Downloaded binaries grouped by the index of the item they belong to
+		const binaryDataByItem = new Map<number, { [key: string]: any }>();
 
 		// Helper function to get file extension from content type
 		function getFileExtensionFromContentType(contentType: string): string {
@@ -2204,14 +2204,18 @@ export async function execute(
 								const binaryKey = `item_${itemIndex}_${fieldName}`;
 								const fileName = `${binaryKey}_${Date.now()}.${getFileExtensionFromContentType(contentType)}`;
 
-								// Add to global binary data
-								globalBinaryData[binaryKey] = {
+								// Add to this item's binary data
+								let itemBinary = binaryDataByItem.get(itemIndex);
+								if (!itemBinary) {
+									itemBinary = {};
+									binaryDataByItem.set(itemIndex, itemBinary);
+								}
+								itemBinary[fieldName] = {
 									data: base64Data,
 									mimeType: contentType,
 									fileName: fileName,
 									fileSize: size
 								};
-								hasBinaryData = true;
 
 								this.logger.info(formatOperationLog('Collector', nodeName, nodeId, index,
 									`Successfully downloaded binary data for "${fieldName}": ${fileName} (${contentType}, ${size} bytes)`));
@@ -2245,7 +2249,7 @@ export async function execute(
 		}
 
 		// Add individual items without collection debug duplication
-		for (const item of collectedItems) {
+		for (const [itemIndex, item] of collectedItems.entries()) {
 			const itemData: INodeExecutionData = {
 				json: {
 					...(outputInputData && items[index]?.json ? items[index].json : {}),
@@ -2259,23 +2263,10 @@ export async function execute(
 			};
 
 			// Add binary data if this item has any
-			if (hasBinaryData) {
-				const itemBinary: { [key: string]: any } = {};
-				const itemIndex = collectedItems.indexOf(item);
-
-				// Find binary data for this specific item
-				for (const [binaryKey, binaryValue] of Object.entries(globalBinaryData)) {
-					if (binaryKey.startsWith(`item_${itemIndex}_`)) {
-						// Extract field name from binary key
-						const fieldName = binaryKey.replace(`item_${itemIndex}_`, '');
-						itemBinary[fieldName] = binaryValue;
-					}
-				}
-
-				// Only add binary if this specific item has binary data
-				if (Object.keys(itemBinary).length > 0) {
-					itemData.binary = itemBinary;
-				}
+			// Only add binary if this specific item has binary data
+			const itemBinary = binaryDataByItem.get(itemIndex);
+			if (itemBinary) {
+				itemData.binary = itemBinary;
 			}
 
 			returnItems.push(itemData);
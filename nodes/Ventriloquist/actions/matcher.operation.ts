@@ -1652,6 +1652,7 @@ export async function execute(
 			},
 			// Add information about matches that helps explain the selection
 			matchDetails: {
+				// Sorts in place on purpose: allComparisons shares this array and is output richest first
 				richestMatch: matchResult.comparisons?.sort((a: IEntityMatchResult, b: IEntityMatchResult) =>
 					(b.informationRichness || 0) - (a.informationRichness || 0)
 				)[0] || null,
@@ -81,17 +81,11 @@ export class LocalChromeTransport implements BrowserTransport {
       };
 
       // Write preferences BEFORE Chrome launches (critical timing)
+      // writeFileSync throws if the file can't be written, so no separate read-back check is needed
       fs.writeFileSync(prefsPath, JSON.stringify(preferencesContent, null, 2));
       this.logger.info(`Created Chrome preferences file: ${prefsPath}`);
       this.logger.info(`Preferences content: ${JSON.stringify(preferencesContent)}`);
-
-      // Verify the file was created correctly
-      if (fs.existsSync(prefsPath)) {
-        const verification = fs.readFileSync(prefsPath, 'utf-8');
-        this.logger.info('Preferences file verified and ready for Chrome launch');
-      } else {
-        this.logger.error('Failed to create preferences file');
-      }
+      this.logger.info('Preferences file ready for Chrome launch');
 
     } catch (error) {
       this.logger.warn(`Failed to create Chrome preferences: ${(error as Error).message}`);
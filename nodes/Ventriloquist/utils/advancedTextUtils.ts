@@ -84,21 +84,30 @@ export function extractKeyPhrases(text: string, maxPhrases = 5): string[] {
     removeExtraSpaces: true
   });
 
-  const words = normalized.split(/\s+/).filter(word =>
-    word.length > 3 && !STOP_WORDS.has(word.toLowerCase())
-  );
-
-  // Count word frequency
+  // Count word frequency while filtering, instead of building a filtered word list first
   const wordCounts: Record<string, number> = {};
-  for (const word of words) {
-    wordCounts[word] = (wordCounts[word] || 0) + 1;
+  for (const word of normalized.split(/\s+/)) {
+    if (word.length > 3 && !STOP_WORDS.has(word)) {
+      wordCounts[word] = (wordCounts[word] || 0) + 1;
+    }
+  }
+
+  // Keep only the top phrases by frequency instead of sorting every word (ties keep first-seen order)
+  const top: Array<[string, number]> = [];
+  for (const entry of Object.entries(wordCounts)) {
+    let position = top.length;
+    while (position > 0 && top[position - 1][1] < entry[1]) {
+      position--;
+    }
+    if (position < maxPhrases) {
+      top.splice(position, 0, entry);
+      if (top.length > maxPhrases) {
+        top.pop();
+      }
+    }
   }
 
-  // Sort by frequency and return top phrases
-  return Object.entries(wordCounts)
-    .sort((a, b) => b[1] - a[1])
-    .slice(0, maxPhrases)
-    .map(([word]) => word);
+  return top.map(([word]) => word);
 }
 
 /**
@@ -52,6 +52,87 @@ export const DEFAULT_COMPARISON_OPTIONS: IStringComparisonOptions = {
     }
 };
 
+/**
+ * Tags whose content is never visible, removed together with their content
+ */
+const NON_VISIBLE_TAGS = [
+    'script', 'style', 'meta', 'link', 'embed', 'object',
+    'canvas', 'applet', 'noscript', 'svg', 'template',
+    'command', 'keygen', 'source', 'param', 'track',
+    'head', 'frame', 'frameset', 'video', 'audio'
+];
+
+/**
+ * Block-level elements that are replaced with newlines
+ */
+const BLOCK_ELEMENTS = [
+    'div', 'p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+    'ul', 'ol', 'li', 'table', 'tr', 'pre', 'blockquote',
+    'header', 'footer', 'section', 'article', 'aside',
+    'nav', 'form', 'fieldset', 'figure', 'figcaption',
+    'details', 'summary', 'dd', 'dt'
+];
+
+/**
+ * Named HTML entities decoded by extractTextFromHtml
+ */
+const HTML_ENTITIES: Record<string, string> = {
+    '&nbsp;': ' ',
+    '&amp;': '&',
+    '&lt;': '<',
+    '&gt;': '>',
+    '&quot;': '"',
+    '&#39;': "'",
+    '&apos;': "'",
+    '&mdash;': '—',
+    '&ndash;': '–',
+    '&hellip;': '...',
+    '&lsquo;': "'",
+    '&rsquo;': "'",
+    '&ldquo;': '"',
+    '&rdquo;': '"',
+    '&bull;': '•',
+    '&copy;': '©',
+    '&reg;': '®',
+    '&trade;': '™',
+    '&cent;': '¢',
+    '&pound;': '£',
+    '&euro;': '€',
+    '&yen;': '¥',
+    '&deg;': '°',
+    '&sect;': '§',
+    '&para;': '¶',
+    '&dagger;': '†',
+    '&Dagger;': '‡',
+    '&permil;': '‰',
+    '&laquo;': '«',
+    '&raquo;': '»',
+    '&times;': '×',
+    '&divide;': '÷',
+    '&plusmn;': '±',
+    '&micro;': 'µ',
+    '&middot;': '·',
+    '&frac14;': '¼',
+    '&frac12;': '½',
+    '&frac34;': '¾',
+    '&prime;': '′',
+    '&Prime;': '″',
+    '&mu;': 'μ',
+    '&pi;': 'π'
+};
+
+// Patterns for extractTextFromHtml, compiled once instead of on every call
+const NON_VISIBLE_TAG_PATTERNS = NON_VISIBLE_TAGS.map(tag =>
+    new RegExp(`<${tag}\\b[^<]*(?:(?!<\\/${tag}>)<[^<]*)*<\\/${tag}>`, 'gi')
+);
+const BLOCK_ELEMENT_PATTERNS = BLOCK_ELEMENTS.map(tag => ({
+    openRegex: new RegExp(`<${tag}[^>]*>`, 'gi'),
+    closeRegex: new RegExp(`<\\/${tag}>`, 'gi'),
+}));
+const HTML_ENTITY_PATTERNS = Object.entries(HTML_ENTITIES).map(
+    ([entity, replacement]): [RegExp, string] => [new RegExp(entity, 'g'), replacement]
+);
+
 /**
  * Extract visible text content from HTML
  * Removes all HTML tags while preserving text structure
@@ -74,34 +155,15 @@ export function extractTextFromHtml(html: string): string {
     text = text.replace(/<iframe\b[^<]*(?:(?!<\/iframe>)<[^<]*)*<\/iframe>/gi, '');
 
     // Remove all other non-visible elements
-    const nonVisibleTags = [
-        'script', 'style', 'meta', 'link', 'embed', 'object',
-        'canvas', 'applet', 'noscript', 'svg', 'template',
-        'command', 'keygen', 'source', 'param', 'track',
-        'head', 'frame', 'frameset', 'video', 'audio'
-    ];
-
-    // Remove each tag type
-    nonVisibleTags.forEach(tag => {
-        const regex = new RegExp(`<${tag}\\b[^<]*(?:(?!<\\/${tag}>)<[^<]*)*<\\/${tag}>`, 'gi');
+    for (const regex of NON_VISIBLE_TAG_PATTERNS) {
         text = text.replace(regex, '');
-    });
+    }
 
     // STEP 2: Replace common structural elements with newlines
-    const blockElements = [
-        'div', 'p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
-        'ul', 'ol', 'li', 'table', 'tr', 'pre', 'blockquote',
-        'header', 'footer', 'section', 'article', 'aside',
-        'nav', 'form', 'fieldset', 'figure', 'figcaption',
-        'details', 'summary', 'dd', 'dt'
-    ];
-
-    blockElements.forEach(tag => {
-        const openRegex = new RegExp(`<${tag}[^>]*>`, 'gi');
-        const closeRegex = new RegExp(`<\\/${tag}>`, 'gi');
+    for (const { openRegex, closeRegex } of BLOCK_ELEMENT_PATTERNS) {
         text = text.replace(openRegex, '\n');
         text = text.replace(closeRegex, '\n');
-    });
+    }
 
     // STEP 3: Handle line breaks
     text = text.replace(/<br[^>]*>/gi, '\n');
@@ -111,55 +173,9 @@ export function extractTextFromHtml(html: string): string {
     text = text.replace(/<[^>]*>/g, '');
 
     // STEP 5: Decode HTML entities (comprehensive list)
-    const htmlEntities: Record<string, string> = {
-        '&nbsp;': ' ',
-        '&amp;': '&',
-        '&lt;': '<',
-        '&gt;': '>',
-        '&quot;': '"',
-        '&#39;': "'",
-        '&apos;': "'",
-        '&mdash;': '—',
-        '&ndash;': '–',
-        '&hellip;': '...',
-        '&lsquo;': "'",
-        '&rsquo;': "'",
-        '&ldquo;': '"',
-        '&rdquo;': '"',
-        '&bull;': '•',
-        '&copy;': '©',
-        '&reg;': '®',
-        '&trade;': '™',
-        '&cent;': '¢',
-        '&pound;': '£',
-        '&euro;': '€',
-        '&yen;': '¥',
-        '&deg;': '°',
-        '&sect;': '§',
-        '&para;': '¶',
-        '&dagger;': '†',
-        '&Dagger;': '‡',
-        '&permil;': '‰',
-        '&laquo;': '«',
-        '&raquo;': '»',
-        '&times;': '×',
-        '&divide;': '÷',
-        '&plusmn;': '±',
-        '&micro;': 'µ',
-        '&middot;': '·',
-        '&frac14;': '¼',
-        '&frac12;': '½',
-        '&frac34;': '¾',
-        '&prime;': '′',
-        '&Prime;': '″',
-        '&mu;': 'μ',
-        '&pi;': 'π'
-    };
-
-    // Replace common entities
-    Object.entries(htmlEntities).forEach(([entity, replacement]) => {
-        text = text.replace(new RegExp(entity, 'g'), replacement);
-    });
+    for (const [regex, replacement] of HTML_ENTITY_PATTERNS) {
+        text = text.replace(regex, replacement);
+    }
 
     // More comprehensive entity decoding for numeric entities
     text = text.replace(/&#(\d+);/g, (match, dec) => String.fromCharCode(parseInt(dec, 10)));
@@ -291,6 +307,8 @@ export function levenshteinDistance(a: string, b: string): number {
 export function levenshteinSimilarity(a: string, b: string): number {
     if (!a && !b) return 1;
     if (!a || !b) return 0;
+    // Identical strings are common among candidates, skip the O(n*m) matrix for them
+    if (a === b) return 1;
 
     const distance = levenshteinDistance(a, b);
     const maxLength = Math.max(a.length, b.length);
@@ -305,6 +323,7 @@ export function levenshteinSimilarity(a: string, b: string): number {
 export function jaccardSimilarity(a: string, b: string): number {
     if (!a && !b) return 1;
     if (!a || !b) return 0;
+    if (a === b) return 1;
 
     // Split into words and filter empty strings
     const aSet = new Set(a.split(/\s+/).filter(Boolean));
@@ -575,6 +594,20 @@ export function smartSimilarity(reference: string, target: string): number {
     return Math.min(1, baseScore + (richness * 0.05));
 }
 
+/**
+ * Merge partial comparison options over the defaults
+ */
+function mergeComparisonOptions(options: Partial<IStringComparisonOptions>): IStringComparisonOptions {
+    return {
+        ...DEFAULT_COMPARISON_OPTIONS,
+        ...options,
+        normalization: {
+            ...DEFAULT_COMPARISON_OPTIONS.normalization,
+            ...options.normalization
+        }
+    };
+}
+
 /**
  * Compare strings using the selected algorithm with improved logging
  */
@@ -585,14 +618,7 @@ export function compareStrings(
     logger?: ILogger
 ): number {
     try {
-        const mergedOptions: IStringComparisonOptions = {
-            ...DEFAULT_COMPARISON_OPTIONS,
-            ...options,
-            normalization: {
-                ...DEFAULT_COMPARISON_OPTIONS.normalization,
-                ...options.normalization
-            }
-        };
+        const mergedOptions = mergeComparisonOptions(options);
 
         // Normalize strings for comparison
         const normalizedStr1 = normalizeTextForComparison(str1, mergedOptions);
@@ -607,6 +633,23 @@ export function compareStrings(
             - Normalized 2: "${normalizedStr2?.substring(0, 50)}${normalizedStr2?.length > 50 ? '...' : ''}"`);
         }
 
+        return compareNormalizedStrings(normalizedStr1, normalizedStr2, mergedOptions, logger);
+    } catch (error) {
+        logger?.error(`Error comparing strings: ${(error as Error).message}`);
+        return 0;
+    }
+}
+
+/**
+ * Compare two already-normalized strings using the selected algorithm
+ */
+function compareNormalizedStrings(
+    normalizedStr1: string,
+    normalizedStr2: string,
+    mergedOptions: IStringComparisonOptions,
+    logger?: ILogger
+): number {
+    try {
         // Special case: both strings empty
         if (!normalizedStr1 && !normalizedStr2) return 0.5; // Changed - empty should partially match empty (neutral)
 
@@ -709,6 +752,42 @@ export function meetsThreshold(similarity: number, threshold?: number): boolean
     return similarity >= thresholdValue;
 }
 
+/**
+ * Normalized reference values, cached per source entity object.
+ * A source entity is usually compared against many extracted items, so its values
+ * only need to be normalized once rather than once per item.
+ */
+const normalizedSourceCache = new WeakMap<object, Map<string, string>>();
+
+/**
+ * Source entities whose empty fields have already been reported, so the same
+ * messages are not rebuilt and logged again for every compared item
+ */
+const reportedEmptySources = new WeakSet<object>();
+
+/**
+ * Get a cached value for a source entity, computing it on first access
+ */
+function getCachedSourceValue(
+    sourceEntity: object,
+    cacheKey: string,
+    compute: () => string
+): string {
+    let entityCache = normalizedSourceCache.get(sourceEntity);
+    if (!entityCache) {
+        entityCache = new Map<string, string>();
+        normalizedSourceCache.set(sourceEntity, entityCache);
+    }
+
+    let value = entityCache.get(cacheKey);
+    if (value === undefined) {
+        value = compute();
+        entityCache.set(cacheKey, value);
+    }
+
+    return value;
+}
+
 /**
  * Compare two entities across multiple fields with improved default handling
  */
@@ -743,21 +822,27 @@ export function compareEntities(
         }
     }
 
-    // Check for empty source fields and log a warning
-    const emptyFields = Object.entries(sourceEntity)
-        .filter(([_, value]) => !value || (typeof value === 'string' && value.trim() === ''))
-        .map(([field]) => field);
+    // Check for empty source fields and log a warning (single pass - also tells us whether every field is empty)
+    const sourceFieldNames = Object.keys(sourceEntity);
+    const emptyFields: string[] = [];
+    for (const field of sourceFieldNames) {
+        const value = sourceEntity[field];
+        if (!value || (typeof value === 'string' && value.trim() === '')) {
+            emptyFields.push(field);
+        }
+    }
+
+    const reportEmptySource = !!logger && !reportedEmptySources.has(sourceEntity);
+    if (reportEmptySource) {
+        reportedEmptySources.add(sourceEntity);
+    }
 
-    if (emptyFields.length > 0 && logger) {
+    if (emptyFields.length > 0 && logger && reportEmptySource) {
         logger.debug(`Empty source fields detected: ${emptyFields.join(', ')}. These won't contribute positively to matches.`);
     }
 
     // If all fields are empty, we can't make a meaningful comparison
-    const allFieldsEmpty = Object.keys(sourceEntity).length > 0 &&
-                           Object.keys(sourceEntity).every(key =>
-                               !sourceEntity[key] ||
-                               (typeof sourceEntity[key] === 'string' &&
-                                sourceEntity[key]!.trim() === ''));
+    const allFieldsEmpty = sourceFieldNames.length > 0 && emptyFields.length === sourceFieldNames.length;
 
     if (allFieldsEmpty) {
         if (logger) {
@@ -778,7 +863,7 @@ export function compareEntities(
 
         // Skip fields with empty references unless they're required
         if ((!sourceValue || (typeof sourceValue === 'string' && sourceValue.trim() === ''))) {
-            if (logger) {
+            if (logger && reportEmptySource) {
                 logger.debug(`Field "${config.field}" has empty reference value and won't contribute to matching.`);
             }
 
@@ -787,7 +872,7 @@ export function compareEntities(
                 fieldSimilarities[config.field] = 0;
                 requiredFieldsMet = false;
 
-                if (logger) {
+                if (logger && reportEmptySource) {
                     logger.warn(`Required field "${config.field}" has empty reference value and fails automatic matching`);
                 }
             }
@@ -844,12 +929,36 @@ export function compareEntities(
             };
         }
 
-        const similarity = compareStrings(
-            finalSourceValue,
-            finalTargetValue,
-            comparisonOptions,
-            logger
-        );
+        const mergedOptions = mergeComparisonOptions(comparisonOptions);
+
+        // The reference side is the same for every item, so reuse its normalized form.
+        // The key includes the raw value, so a source entity that changes is normalized again
+        let similarity = 0;
+        try {
+            // The reference side is the same for every item, so reuse its normalized form.
+            // The key includes the raw value, so a source entity that changes is normalized again
+            const normalizationKey = `${comparisonOptions.normalization ? 'explicit' : 'default'}:${finalSourceValue}`;
+            const normalizedSource = getCachedSourceValue(sourceEntity, normalizationKey, () =>
+                normalizeTextForComparison(finalSourceValue, mergedOptions)
+            );
+            const normalizedTarget = normalizeTextForComparison(finalTargetValue, mergedOptions);
+
+            if (logger && debugMode) {
+                logger.debug(`Comparing field "${config.field}":
+                - Normalized source: "${normalizedSource.substring(0, 50)}${normalizedSource.length > 50 ? '...' : ''}"
+                - Normalized target: "${normalizedTarget.substring(0, 50)}${normalizedTarget.length > 50 ? '...' : ''}"`);
+            }
+
+            similarity = compareNormalizedStrings(
+                normalizedSource,
+                normalizedTarget,
+                mergedOptions,
+                logger
+            );
+        } catch (error) {
+            // A field that fails to normalize scores 0, as compareStrings does
+            logger?.error(`Error comparing strings: ${(error as Error).message}`);
+        }
 
         fieldSimilarities[config.field] = similarity;
 
@@ -11,6 +11,7 @@ import {
   compareStrings,
   compareEntities,
   IStringComparisonOptions,
+  type IFieldComparisonConfig,
   containmentSimilarity,
   smartSimilarity,
   calculateInformationRichness
@@ -126,6 +127,14 @@ export class EntityMatcherComparisonMiddleware implements IMiddleware<IEntityMat
     const threshold = comparisonConfig.threshold || 0.7;
     const hasRequiredFields = comparisonConfig.fieldComparisons.some(fc => fc.mustMatch);
 
+    // Index field comparison configs by field name once, instead of scanning the list for every field of every item
+    const fieldComparisonsByName = new Map<string, IFieldComparisonConfig>();
+    for (const fc of comparisonConfig.fieldComparisons) {
+      if (!fieldComparisonsByName.has(fc.field)) {
+        fieldComparisonsByName.set(fc.field, fc);
+      }
+    }
+
     logger.debug(`${logPrefix} Starting comparison of ${extractedItems.length} items against source fields with threshold ${threshold}`);
     logger.debug(`${logPrefix} Has required fields: ${hasRequiredFields}`);
     logger.debug(`${logPrefix} Field comparisons: ${JSON.stringify(comparisonConfig.fieldComparisons.map(fc => ({ field: fc.field, mustMatch: fc.mustMatch })))}`);
@@ -134,8 +143,26 @@ export class EntityMatcherComparisonMiddleware implements IMiddleware<IEntityMat
     let itemsSkippedRequiredFields = 0;
     let itemsSkippedErrors = 0;
 
+    // Only field comparisons with a target selector need a browser lookup - pick them out once for all items
+    const selectorComparisons = comparisonConfig.fieldComparisons.filter(
+      (fc): fc is IFieldComparisonConfig & { selector: string } => !!fc.selector && fc.selector.trim() !== ''
+    );
+
+    // Items are independent, so resolve target selectors a few items at a time rather than one browser
+    // round-trip at a time, without flooding the page with hundreds of concurrent element lookups
+    const targetOverrides: Array<Record<string, string>> = [];
+    if (selectorComparisons.length > 0) {
+      const chunkSize = 5;
+      for (let i = 0; i < extractedItems.length; i += chunkSize) {
+        const chunk = extractedItems.slice(i, i + chunkSize);
+        targetOverrides.push(...await Promise.all(
+          chunk.map(item => this.getTargetOverrides(item, selectorComparisons, logger, logPrefix))
+        ));
+      }
+    }
+
     // Process each extracted item
-    for (const item of extractedItems) {
+    for (const [itemPosition, item] of extractedItems.entries()) {
       try {
         itemsProcessed++;
         logger.debug(`${logPrefix} Processing item #${item.index} (${itemsProcessed}/${extractedItems.length})`);
@@ -152,29 +179,9 @@ export class EntityMatcherComparisonMiddleware implements IMiddleware<IEntityMat
         const fieldsToBeTested = Object.keys(itemFields);
         logger.debug(`${logPrefix} Item #${item.index} fields: ${fieldsToBeTested.join(', ')}`);
 
-        // For each field comparison with a selector, get the targeted content from the item's field
-        for (const fieldComparison of comparisonConfig.fieldComparisons) {
-          if (fieldComparison.selector && fieldComparison.selector.trim() !== '' && item.element) {
-            try {
-              // Try to get the element using the target selector
-              const targetValue = await this.getTargetContent(
-                item.element,
-                fieldComparison.selector,
-                logger,
-                logPrefix
-              );
-
-              if (targetValue) {
-                // Override the field value with the targeted content
-                itemFields[fieldComparison.field] = targetValue;
-                logger.debug(`${logPrefix} Applied target selector "${fieldComparison.selector}" for field "${fieldComparison.field}": "${targetValue}"`);
-              } else {
-                logger.debug(`${logPrefix} Target selector "${fieldComparison.selector}" for field "${fieldComparison.field}" returned empty value`);
-              }
-            } catch (error) {
-              logger.warn(`${logPrefix} Error applying target selector "${fieldComparison.selector}": ${(error as Error).message}`);
-            }
-          }
+        // Override field values with any content resolved through target selectors
+        if (targetOverrides.length > 0) {
+          Object.assign(itemFields, targetOverrides[itemPosition]);
         }
 
         // Perform the comparison using our utility
@@ -196,7 +203,7 @@ export class EntityMatcherComparisonMiddleware implements IMiddleware<IEntityMat
 
         // Debug individual field comparisons
         for (const [field, similarity] of Object.entries(comparisonResult.fieldSimilarities)) {
-          const matchConfig = comparisonConfig.fieldComparisons.find(fc => fc.field === field);
+          const matchConfig = fieldComparisonsByName.get(field);
           const fieldThreshold = matchConfig?.threshold || threshold;
           const sourceValue = sourceFields[field] || '';
           const itemValue = itemFields[field] || '';
@@ -236,6 +243,47 @@ export class EntityMatcherComparisonMiddleware implements IMiddleware<IEntityMat
     return matches;
   }
 
+  /**
+   * Resolve target selector content for an item's fields
+   */
+  private async getTargetOverrides(
+    item: IExtractedItem,
+    selectorComparisons: Array<IFieldComparisonConfig & { selector: string }>,
+    logger: ILogger,
+    logPrefix: string
+  ): Promise<Record<string, string>> {
+    const overrides: Record<string, string> = {};
+
+    if (!item.element) {
+      return overrides;
+    }
+
+    // For each field comparison with a selector, get the targeted content from the item's field
+    for (const fieldComparison of selectorComparisons) {
+      try {
+        // Try to get the element using the target selector
+        const targetValue = await this.getTargetContent(
+          item.element,
+          fieldComparison.selector,
+          logger,
+          logPrefix
+        );
+
+        if (targetValue) {
+          // Override the field value with the targeted content
+          overrides[fieldComparison.field] = targetValue;
+          logger.debug(`${logPrefix} Applied target selector "${fieldComparison.selector}" for field "${fieldComparison.field}" of item #${item.index}: "${targetValue}"`);
+        } else {
+          logger.debug(`${logPrefix} Target selector "${fieldComparison.selector}" for field "${fieldComparison.field}" of item #${item.index} returned empty value`);
+        }
+      } catch (error) {
+        logger.warn(`${logPrefix} Error applying target selector "${fieldComparison.selector}": ${(error as Error).message}`);
+      }
+    }
+
+    return overrides;
+  }
+
   /**
    * Extract text content using a selector from an element
    */
@@ -334,13 +382,16 @@ export class EntityMatcherComparisonMiddleware implements IMiddleware<IEntityMat
 
     logger.info(`${logPrefix} Applying match mode: ${matchMode} with threshold: ${threshold}`);
 
-    // Make sure all items are initially not selected
+    // Reset selection and collect matches above threshold in a single pass
+    const matchesAboveThresholdArray: IEntityMatchResult[] = [];
     for (const match of limitedMatches) {
       match.selected = false;
+      if (match.overallSimilarity >= threshold) {
+        matchesAboveThresholdArray.push(match);
+      }
     }
 
-    // Count how many matches are above threshold for logging
-    const matchesAboveThreshold = limitedMatches.filter(m => m.overallSimilarity >= threshold).length;
+    const matchesAboveThreshold = matchesAboveThresholdArray.length;
     logger.info(`${logPrefix} Found ${matchesAboveThreshold} matches above threshold out of ${limitedMatches.length} total`);
 
     // If no matches above threshold, return with no selected items
@@ -349,24 +400,23 @@ export class EntityMatcherComparisonMiddleware implements IMiddleware<IEntityMat
       return limitedMatches;
     }
 
-    // Filter matches above threshold for selection
-    const matchesAboveThresholdArray = limitedMatches.filter(m => m.overallSimilarity >= threshold);
+    let selectedMatches = 0;
 
     switch (matchMode) {
       case 'all':
         // All matches above threshold are selected
-        for (const match of limitedMatches) {
-          if (match.overallSimilarity >= threshold) {
-            match.selected = true;
-            logger.debug(`${logPrefix} Selected match #${match.index} with score: ${match.overallSimilarity.toFixed(4)}, richness: ${(match.informationRichness || 0).toFixed(4)}`);
-          }
+        for (const match of matchesAboveThresholdArray) {
+          match.selected = true;
+          logger.debug(`${logPrefix} Selected match #${match.index} with score: ${match.overallSimilarity.toFixed(4)}, richness: ${(match.informationRichness || 0).toFixed(4)}`);
         }
+        selectedMatches = matchesAboveThreshold;
         break;
 
       case 'firstAboveThreshold':
         // First match above threshold is selected
         if (matchesAboveThresholdArray.length > 0) {
           matchesAboveThresholdArray[0].selected = true;
+          selectedMatches = 1;
           logger.debug(
             `${logPrefix} Selected first match #${matchesAboveThresholdArray[0].index} with score: ${matchesAboveThresholdArray[0].overallSimilarity.toFixed(4)}, richness: ${(matchesAboveThresholdArray[0].informationRichness || 0).toFixed(4)}`
           );
@@ -379,6 +429,7 @@ export class EntityMatcherComparisonMiddleware implements IMiddleware<IEntityMat
         if (matchesAboveThresholdArray.length > 0) {
           // Since we already sorted, the best match is the first one above threshold
           matchesAboveThresholdArray[0].selected = true;
+          selectedMatches = 1;
           logger.debug(
             `${logPrefix} Selected best match #${matchesAboveThresholdArray[0].index} with score: ${matchesAboveThresholdArray[0].overallSimilarity.toFixed(4)}, richness: ${(matchesAboveThresholdArray[0].informationRichness || 0).toFixed(4)}`
           );
@@ -388,8 +439,6 @@ export class EntityMatcherComparisonMiddleware implements IMiddleware<IEntityMat
         break;
     }
 
-    // Count selected matches for logging
-    const selectedMatches = limitedMatches.filter(m => m.selected).length;
     logger.info(`${logPrefix} Selected ${selectedMatches} matches based on match mode: ${matchMode}`);
 
     return limitedMatches;